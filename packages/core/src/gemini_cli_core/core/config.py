@@ -1,6 +1,7 @@
 import os
 import pathlib
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -19,6 +20,9 @@ DEFAULT_GEMINI_MODEL = "gemini-2.0-flash-exp"
 DEFAULT_GEMINI_FLASH_MODEL = "gemini-2.0-flash"
 DEFAULT_EMBEDDING_MODEL = "text-embedding-004"
 
+# CPU-bound tool work (HTML conversion, grounding post-processing)
+CPU_POOL_MAX_WORKERS = 4
+
 # Directory constants
 GEMINI_CONFIG_DIR = ".gemini"
 SETTINGS_DIRECTORY_NAME = ".gemini"
@@ -90,6 +94,7 @@ class Config(BaseModel):
     _content_generator_config: Any | None = None
     _file_discovery_service: Any | None = None
     _git_service: Any | None = None
+    _cpu_pool: ThreadPoolExecutor | None = None
 
     def model_post_init(self, __context: Any) -> None:
         """初始化后处理"""
@@ -319,6 +324,15 @@ class Config(BaseModel):
             self._file_discovery_service = FileDiscoveryService(self.target_dir)
         return self._file_discovery_service
 
+    def get_cpu_executor(self) -> ThreadPoolExecutor:
+        """获取CPU密集型任务线程池 - 延迟加载"""
+        if self._cpu_pool is None:
+            self._cpu_pool = ThreadPoolExecutor(
+                max_workers=CPU_POOL_MAX_WORKERS,
+                thread_name_prefix="gemini-cpu",
+            )
+        return self._cpu_pool
+
     async def get_git_service(self) -> Any:
         """获取Git服务 - 延迟加载"""
         if not self._git_service:
@@ -1,8 +1,42 @@
 import asyncio
 from typing import Any, Protocol
 
+from gemini_cli_core.utils.cache import lru_cache
+
 from .types import GeminiEventType, ServerGeminiStreamEvent
 
+# 特殊情况处理
+_SPECIAL_CAMEL_CASES = {
+    "call_id": "callId",
+    "tool_name": "toolName",
+    "display_name": "displayName",
+    "file_path": "filePath",
+    "error_type": "errorType",
+    "auth_type": "authType",
+    "function_response": "functionResponse",
+    "function_call": "functionCall",
+    "tool_calls": "toolCalls",
+    "original_token_count": "originalTokenCount",
+    "new_token_count": "newTokenCount",
+    "next_speaker": "nextSpeaker",
+    "turn_id": "turnId",
+    "session_id": "sessionId",
+    "duration_ms": "durationMs",
+    "status_code": "statusCode",
+    "result_display": "resultDisplay",
+}
+
+
+@lru_cache(maxsize=1024)
+def _to_camel_key(key: str) -> str:
+    """转换单个键 (事件字段名是有限集合, 结果缓存)"""
+    if key in _SPECIAL_CAMEL_CASES:
+        return _SPECIAL_CAMEL_CASES[key]
+
+    # 通用转换
+    components = key.split("_")
+    return components[0] + "".join(x.title() for x in components[1:])
+
 
 class WebSocketProtocol(Protocol):
     """WebSocket协议接口"""
@@ -154,47 +188,20 @@ class EventEmitter:
 
         """
 
-        def convert_key(key: str) -> str:
-            """转换单个键"""
-            # 特殊情况处理
-            special_cases = {
-                "call_id": "callId",
-                "tool_name": "toolName",
-                "display_name": "displayName",
-                "file_path": "filePath",
-                "error_type": "errorType",
-                "auth_type": "authType",
-                "function_response": "functionResponse",
-                "function_call": "functionCall",
-                "tool_calls": "toolCalls",
-                "original_token_count": "originalTokenCount",
-                "new_token_count": "newTokenCount",
-                "next_speaker": "nextSpeaker",
-                "turn_id": "turnId",
-                "session_id": "sessionId",
-                "duration_ms": "durationMs",
-                "status_code": "statusCode",
-                "result_display": "resultDisplay",
-            }
-
-            if key in special_cases:
-                return special_cases[key]
-
-            # 通用转换
-            components = key.split("_")
-            return components[0] + "".join(x.title() for x in components[1:])
-
         def convert_value(value: Any) -> Any:
             """递归转换值"""
             if isinstance(value, dict):
                 return {
-                    convert_key(k): convert_value(v) for k, v in value.items()
+                    _to_camel_key(k): convert_value(v)
+                    for k, v in value.items()
                 }
             if isinstance(value, list):
                 return [convert_value(item) for item in value]
             return value
 
-        return {convert_key(k): convert_value(v) for k, v in snake_dict.items()}
+        return {
+            _to_camel_key(k): convert_value(v) for k, v in snake_dict.items()
+        }
 
 
 class EventCollector:
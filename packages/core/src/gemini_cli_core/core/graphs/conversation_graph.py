@@ -286,14 +286,20 @@ class EventAwareGraph:
         # 启动图的执行
         graph_task = asyncio.create_task(graph_runner())
 
-        # 从队列中 yield 事件，直到收到结束信号
-        while True:
-            event = await self.event_queue.get()
-            if event is None:
-                break
-            yield event
-
-        await graph_task
+        try:
+            # 从队列中 yield 事件，直到收到结束信号
+            # (每个流式 token 都会经过这里，先绑定为局部变量)
+            next_event = self.event_queue.get
+            while (event := await next_event()) is not None:
+                yield event
+        finally:
+            # 调用方取消或提前退出时一并取消图的执行, 并等待其结束,
+            # 使它不会再向队列放入事件或结束信号
+            if not graph_task.done():
+                graph_task.cancel()
+            await asyncio.gather(graph_task, return_exceptions=True)
+            # 图实例会在会话内复用, 下一次运行从空队列开始
+            self.event_queue = asyncio.Queue()
 
     def set_content_generator(self, generator):
         """设置内容生成器"""
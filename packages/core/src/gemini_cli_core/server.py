@@ -10,12 +10,15 @@ from sse_starlette.sse import EventSourceResponse
 
 from gemini_cli_core.core.app import GeminiClient
 from gemini_cli_core.core.config import Config
+from gemini_cli_core.utils.fetch import close_shared_client
 
 app = FastAPI(
     title="Gemini CLI Core Backend",
     description="The Python backend for Gemini CLI, powered by LangGraph.",
     version="0.1.0",
 )
+# Release the pooled HTTP connections used by web fetches and model probes.
+app.router.add_event_handler("shutdown", close_shared_client)
 
 
 class SessionManager:
@@ -6,9 +6,10 @@ import httpx
 from gemini_cli_core.services.auth_service import (
     get_oauth_credentials,
 )
-from gemini_cli_core.utils.response_utils import (
+from gemini_cli_core.utils.vertex_converter import (
     from_count_token_response,
     from_generate_content_response,
+    to_builtins,
     to_count_token_request,
     to_generate_content_request,
 )
@@ -64,7 +65,7 @@ class CodeAssistService:
 
         async with httpx.AsyncClient() as client:
             response = await client.post(
-                url, json=ca_request.model_dump(), headers=self._headers
+                url, json=to_builtins(ca_request), headers=self._headers
             )
             response.raise_for_status()
             ca_response = response.json()
@@ -92,7 +93,7 @@ class CodeAssistService:
 
         async with httpx.AsyncClient() as client:
             response = await client.post(
-                url, json=ca_request.model_dump(), headers=self._headers
+                url, json=to_builtins(ca_request), headers=self._headers
             )
             response.raise_for_status()
             ca_response = response.json()
@@ -1,3 +1,5 @@
+import os
+from collections.abc import Callable
 from pathlib import Path
 
 import pathspec
@@ -14,6 +16,7 @@ class FileDiscoveryService:
 
     def __init__(self, project_root: str):
         self.project_root = Path(project_root).resolve()
+        self._root_prefix = os.path.join(self.project_root, "")
         self.git_ignore_spec: pathspec.PathSpec | None = None
         if is_git_repository(str(self.project_root)):
             self.git_ignore_spec = self._load_spec_from_file(
@@ -48,28 +51,35 @@ class FileDiscoveryService:
         respect_gemini_ignore: bool = True,
     ) -> list[str]:
         """Filters a list of file paths based on git ignore rules."""
-        filtered_paths = []
-        for file_path_str in file_paths:
-            file_path = Path(file_path_str)
-            # pathspec works with relative or absolute paths, but for consistency
-            # with .gitignore behavior, we should use paths relative to the project root.
-            try:
-                relative_path = file_path.relative_to(self.project_root)
-            except ValueError:
-                # The file is outside the project root, decide how to handle.
-                # For now, we'll let it pass the filter.
-                relative_path = file_path
-
-            if respect_git_ignore and self.should_git_ignore_file(
-                str(relative_path)
-            ):
-                continue
-            if respect_gemini_ignore and self.should_gemini_ignore_file(
-                str(relative_path)
-            ):
-                continue
-            filtered_paths.append(file_path_str)
-        return filtered_paths
+        specs = []
+        if respect_git_ignore and self.git_ignore_spec:
+            specs.append(self.git_ignore_spec)
+        if respect_gemini_ignore and self.gemini_ignore_spec:
+            specs.append(self.gemini_ignore_spec)
+        if not specs:
+            return list(file_paths)
+
+        # pathspec works with relative or absolute paths, but for consistency
+        # with .gitignore behavior, we should use paths relative to the
+        # project root. Files outside the root are matched as given.
+        prefix = self._root_prefix
+        relative_paths = [
+            file_path_str[len(prefix) :]
+            if file_path_str.startswith(prefix)
+            else file_path_str
+            for file_path_str in file_paths
+        ]
+        # One match_files pass per spec instead of a match per path.
+        ignored: set[str] = set()
+        for spec in specs:
+            ignored.update(spec.match_files(relative_paths))
+        return [
+            file_path_str
+            for file_path_str, relative_path in zip(
+                file_paths, relative_paths, strict=True
+            )
+            if relative_path not in ignored
+        ]
 
     def should_git_ignore_file(self, file_path: str) -> bool:
         """Checks if a single file should be git-ignored."""
@@ -77,6 +87,15 @@ class FileDiscoveryService:
             return self.git_ignore_spec.match_file(file_path)
         return False
 
+    def get_git_ignore_matcher(self) -> Callable[[str], bool]:
+        """
+        Returns a callable equivalent to should_git_ignore_file, resolved once
+        so traversal loops skip the per-call spec lookup.
+        """
+        if self.git_ignore_spec:
+            return self.git_ignore_spec.match_file
+        return _never_ignored
+
     def should_gemini_ignore_file(self, file_path: str) -> bool:
         """Checks if a single file should be gemini-ignored."""
         if self.gemini_ignore_spec:
@@ -86,3 +105,7 @@ class FileDiscoveryService:
     def get_gemini_ignore_patterns(self) -> list[str]:
         """Returns loaded patterns from .geminiignore."""
         return self.gemini_ignore_patterns
+
+
+def _never_ignored(file_path: str) -> bool:
+    return False
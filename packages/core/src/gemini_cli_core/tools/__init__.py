@@ -9,10 +9,11 @@ This package exposes the core components for tool development and management:
 """
 
 from .base.registry import ToolRegistry
-from .base.tool_base import BaseTool, ToolResult
+from .base.tool_base import BaseTool, ToolResult, params_schema
 
 __all__ = [
     "BaseTool",
     "ToolRegistry",
     "ToolResult",
+    "params_schema",
 ]
@@ -82,6 +82,14 @@ class ToolRegistry:
             )
         self._tools[tool.name] = tool
 
+    def register_many(self, tools: list[Tool]):
+        """Registers several tools in one pass."""
+        for tool in tools:
+            self.register_tool(tool)
+
+    def get_tool_names(self) -> set[str]:
+        return set(self._tools)
+
     async def discover_tools(self):
         # Clear previously discovered tools
         for name, tool in list(self._tools.items()):
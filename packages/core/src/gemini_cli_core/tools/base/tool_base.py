@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from functools import cache
 from typing import Any, Generic, Protocol, TypeVar
 
 from pydantic import BaseModel
@@ -32,6 +33,15 @@ class ToolResult(BaseModel, Generic[TParams]):
         arbitrary_types_allowed = True
 
 
+@cache
+def params_schema(params_cls: type[BaseModel]) -> dict[str, Any]:
+    """
+    Returns the JSON schema of a tool params model. The schema is immutable
+    per class, so it is generated once and shared by all tool instances.
+    """
+    return params_cls.model_json_schema()
+
+
 # --- Tool Protocol (Interface) ---
 class Tool(Protocol[TParams, TResult]):
     """
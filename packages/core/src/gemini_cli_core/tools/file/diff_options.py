@@ -1,6 +1,43 @@
+import difflib
+from collections.abc import Sequence
+
 # In Python's difflib, the equivalent of 'context' is `n` in unified_diff.
 # The equivalent of 'ignoreWhitespace' is not a direct parameter but can be
 # achieved by pre-processing lines if needed. For now, we'll just define
 # the context lines.
 
 DEFAULT_DIFF_CONTEXT_LINES = 3
+
+# Diff text shown for confirmation is cut off beyond this many characters.
+MAX_DIFF_OUTPUT_SIZE = 256 * 1024
+DIFF_TRUNCATED_MARKER = "... (diff truncated)\n"
+
+
+def unified_diff_text(
+    old_lines: Sequence[str],
+    new_lines: Sequence[str],
+    fromfile: str,
+    tofile: str,
+    max_size: int = MAX_DIFF_OUTPUT_SIZE,
+) -> str:
+    """
+    Joins a unified diff, stopping once it exceeds `max_size` characters.
+
+    unified_diff yields lines lazily, so output past the cap is never
+    formatted or held in memory.
+    """
+    parts: list[str] = []
+    total = 0
+    for line in difflib.unified_diff(
+        old_lines,
+        new_lines,
+        fromfile=fromfile,
+        tofile=tofile,
+        n=DEFAULT_DIFF_CONTEXT_LINES,
+    ):
+        parts.append(line)
+        total += len(line)
+        if total > max_size:
+            parts.append(DIFF_TRUNCATED_MARKER)
+            break
+    return "".join(parts)
@@ -1,4 +1,5 @@
-import difflib
+import asyncio
+import hashlib
 from pathlib import Path
 from typing import Any
 
@@ -6,12 +7,12 @@ from pydantic import BaseModel, Field
 
 from gemini_cli_core.core.config import Config
 from gemini_cli_core.core.types import ApprovalMode
-from gemini_cli_core.tools import BaseTool, ToolResult
+from gemini_cli_core.tools import BaseTool, ToolResult, params_schema
 from gemini_cli_core.tools.common import (
     ToolCallConfirmationDetails,
     ToolEditConfirmationDetails,
 )
-from gemini_cli_core.tools.file.diff_options import DEFAULT_DIFF_CONTEXT_LINES
+from gemini_cli_core.tools.file.diff_options import unified_diff_text
 from gemini_cli_core.utils.edit_corrector import ensure_correct_edit
 from gemini_cli_core.utils.paths import (
     is_within_root,
@@ -24,6 +25,15 @@ from ..base.modifiable_tool import (
     ModifyContext,
 )
 
+# Calculated edits kept per tool; a single edit is typically calculated for
+# confirmation, modification and execution.
+MAX_EDIT_CACHE_SIZE = 64
+
+# (st_mtime_ns, st_size, st_ino, st_ctime_ns); mtime alone misses writes
+# within the filesystem's timestamp granularity and replaced files.
+_StatIdentity = tuple[int, int, int, int]
+_EditCacheKey = tuple[str, bytes, bytes, int, _StatIdentity | None]
+
 
 class EditToolParams(BaseModel):
     file_path: str = Field(
@@ -49,6 +59,36 @@ class CalculatedEdit(BaseModel):
     is_new_file: bool
 
 
+def _read_file_if_exists(p: Path) -> str | None:
+    """Reads a file with normalized line endings, or None if it is missing."""
+    try:
+        raw = p.read_bytes()
+    except FileNotFoundError:
+        return None
+    # Same newline handling as text mode, done on bytes and skipped for the
+    # common LF-only file.
+    if b"\r" in raw:
+        raw = raw.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return raw.decode("utf-8")
+
+
+def _stat_identity(p: Path) -> _StatIdentity | None:
+    try:
+        st = p.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino, st.st_ctime_ns)
+
+
+def _digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+def _write_file(p: Path, content: str) -> None:
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_text(content, "utf-8")
+
+
 class EditTool(
     BaseTool[EditToolParams, ToolResult],
     ModifiableTool[EditToolParams],
@@ -62,11 +102,12 @@ class EditTool(
             name=self.NAME,
             display_name="Edit",
             description="Replaces text in a file.",
-            parameter_schema=EditToolParams.model_json_schema(),
+            parameter_schema=params_schema(EditToolParams),
         )
         self.config = config
         self.client = config.get_gemini_client()
         self.root_directory = Path(config.get_target_dir()).resolve()
+        self._edit_cache: dict[_EditCacheKey, CalculatedEdit] = {}
 
     def validate_tool_params(self, params: EditToolParams) -> str | None:
         p = Path(params.file_path)
@@ -82,6 +123,7 @@ class EditTool(
         old_string: str,
         new_string: str,
         is_new_file: bool,
+        occurrences: int = -1,
     ) -> str:
         if is_new_file:
             return new_string
@@ -89,20 +131,44 @@ class EditTool(
             return ""
         if old_string == "":
             return current_content
-        return current_content.replace(old_string, new_string)
+        # With the occurrence count known, str.replace stops searching after
+        # the last match instead of scanning the rest of the file.
+        return current_content.replace(
+            old_string, new_string, occurrences if occurrences > 0 else -1
+        )
 
     async def _calculate_edit(self, params: EditToolParams) -> CalculatedEdit:
+        """
+        Returns the calculated edit for `params`, reusing an earlier result
+        while the target file is unchanged (same mtime).
+        """
         p = Path(params.file_path)
+        key = (
+            params.file_path,
+            _digest(params.old_string),
+            _digest(params.new_string),
+            params.expected_replacements,
+            await asyncio.to_thread(_stat_identity, p),
+        )
+        cached = self._edit_cache.pop(key, None)
+        if cached is None:
+            cached = await self._compute_edit(p, params)
+            if len(self._edit_cache) >= MAX_EDIT_CACHE_SIZE:
+                del self._edit_cache[next(iter(self._edit_cache))]
+        self._edit_cache[key] = cached
+        return cached
+
+    async def _compute_edit(
+        self, p: Path, params: EditToolParams
+    ) -> CalculatedEdit:
         expected_replacements = params.expected_replacements
-        current_content: str | None = None
         error: dict[str, str] | None = None
         final_old_string = params.old_string
         final_new_string = params.new_string
         occurrences = 0
 
-        if p.exists():
-            current_content = p.read_text("utf-8").replace("\r\n", "\n")
-
+        current_content = await asyncio.to_thread(_read_file_if_exists, p)
+        if current_content is not None:
             corrected_edit = await ensure_correct_edit(
                 current_content, params, self.client, None
             )
@@ -127,13 +193,17 @@ class EditTool(
             # For new files, old_string is empty, new_string is the content
             occurrences = 0
 
-        is_new_file = not p.exists() and params.old_string == ""
+        is_new_file = current_content is None and params.old_string == ""
         if is_new_file:
             occurrences = 1  # New file creation is one "occurrence"
             error = None  # Clear error for new file case
 
         new_content = self._apply_replacement(
-            current_content, final_old_string, final_new_string, is_new_file
+            current_content,
+            final_old_string,
+            final_new_string,
+            is_new_file,
+            occurrences,
         )
 
         return CalculatedEdit(
@@ -155,14 +225,13 @@ class EditTool(
             # Maybe log this error for debugging
             return False
 
-        diff = "".join(
-            difflib.unified_diff(
-                (edit_data.current_content or "").splitlines(keepends=True),
-                edit_data.new_content.splitlines(keepends=True),
-                fromfile=f"Original: {params.file_path}",
-                tofile=f"Proposed: {params.file_path}",
-                n=DEFAULT_DIFF_CONTEXT_LINES,
-            )
+        # difflib is pure Python; keep it off the event loop.
+        diff = await asyncio.to_thread(
+            unified_diff_text,
+            (edit_data.current_content or "").splitlines(keepends=True),
+            edit_data.new_content.splitlines(keepends=True),
+            f"Original: {params.file_path}",
+            f"Proposed: {params.file_path}",
         )
 
         return ToolEditConfirmationDetails(
@@ -190,8 +259,12 @@ class EditTool(
 
         p = Path(params.file_path)
         try:
-            p.parent.mkdir(parents=True, exist_ok=True)
-            p.write_text(edit_data.new_content, "utf-8")
+            await asyncio.to_thread(_write_file, p, edit_data.new_content)
+            # The file changed; results for it can no longer be reused.
+            for key in [
+                k for k in self._edit_cache if k[0] == params.file_path
+            ]:
+                del self._edit_cache[key]
 
             return ToolResult(
                 llm_content=f"Successfully edited {params.file_path}",
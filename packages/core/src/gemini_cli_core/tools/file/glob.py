@@ -1,16 +1,183 @@
+import asyncio
+import os
+import re
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 from gemini_cli_core.core.config import Config
-from gemini_cli_core.tools import BaseTool, ToolResult
+from gemini_cli_core.tools import BaseTool, ToolResult, params_schema
+from gemini_cli_core.utils.cache import lru_cache
 from gemini_cli_core.utils.paths import (
     is_within_root,
     make_relative,
     shorten_path,
 )
 
+# Below this many matches a pool costs more than the stats it parallelizes.
+PARALLEL_STAT_THRESHOLD = 64
+MAX_STAT_WORKERS = 32
+
+_stat_pool: ThreadPoolExecutor | None = None
+
+
+def _get_stat_executor() -> ThreadPoolExecutor:
+    """Returns the I/O pool shared by all glob calls, created on first use."""
+    global _stat_pool
+    if _stat_pool is None:
+        _stat_pool = ThreadPoolExecutor(
+            max_workers=MAX_STAT_WORKERS, thread_name_prefix="gemini-stat"
+        )
+    return _stat_pool
+
+
+def _translate_segment(segment: str) -> str:
+    """Translates one glob path segment; wildcards never match '/'."""
+    out = []
+    i, n = 0, len(segment)
+    while i < n:
+        c = segment[i]
+        i += 1
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = i
+            if j < n and segment[j] in "!^":
+                j += 1
+            if j < n and segment[j] == "]":
+                j += 1
+            while j < n and segment[j] != "]":
+                j += 1
+            if j >= n:
+                out.append("\\[")
+            else:
+                body = segment[i:j].replace("\\", "\\\\")
+                if body[:1] in "!^":
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = j + 1
+        else:
+            out.append(re.escape(c))
+    return "".join(out)
+
+
+@lru_cache(maxsize=128)
+def _compile_rglob(pattern: str, case_sensitive: bool) -> re.Pattern[str]:
+    """
+    Compiles `pattern` to a regex over '/'-separated relative file paths
+    with `Path.rglob` semantics: the pattern may match at any depth and
+    '**' spans zero or more directories. Like PurePath, empty and '.'
+    segments are dropped. Raises ValueError for absolute patterns and
+    '..' segments, which would reach outside the searched directory.
+    """
+    if pattern.startswith("/") or os.path.isabs(pattern):
+        raise ValueError(f"Non-relative patterns are unsupported: {pattern}")
+    segments = [seg for seg in pattern.split("/") if seg not in ("", ".")]
+    if ".." in segments:
+        raise ValueError(f"Patterns must not contain '..': {pattern}")
+    if not segments:
+        raise ValueError(f"Unacceptable pattern: {pattern!r}")
+    if segments[-1] == "**":
+        segments.append("*")
+    parts = ["(?:.*/)?"]
+    for segment in segments[:-1]:
+        if segment == "**":
+            parts.append("(?:[^/]+/)*")
+        else:
+            parts.append(_translate_segment(segment) + "/")
+    parts.append(_translate_segment(segments[-1]))
+    flags = 0 if case_sensitive else re.IGNORECASE
+    return re.compile("".join(parts), flags)
+
+
+def _find_matches(
+    root: str,
+    regex: re.Pattern[str],
+    is_ignored: Callable[[str], bool] | None = None,
+    ignore_prefix: str = "",
+) -> tuple[list[str], int]:
+    """
+    Walks `root` with os.scandir and returns (absolute paths, number of
+    ignored matches) for the files whose relative path matches.
+
+    `is_ignored` receives `ignore_prefix` + the path relative to `root`;
+    ignored directories are pruned before they are descended into.
+    """
+    matches: list[str] = []
+    ignored_count = 0
+    stack = [(root, "")]
+    while stack:
+        directory, rel_dir = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    rel_path = rel_dir + entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            rel_path += "/"
+                            if is_ignored is None or not is_ignored(
+                                ignore_prefix + rel_path
+                            ):
+                                stack.append((entry.path, rel_path))
+                        elif entry.is_file() and regex.fullmatch(rel_path):
+                            if is_ignored is not None and is_ignored(
+                                ignore_prefix + rel_path
+                            ):
+                                ignored_count += 1
+                                continue
+                            matches.append(entry.path)
+                    except OSError:
+                        # Deleted or unreadable while listing.
+                        continue
+        except OSError:
+            continue
+    return matches, ignored_count
+
+
+def _mtime_or_none(path: str) -> float | None:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        # Deleted between the walk and the stat.
+        return None
+
+
+def _mtimes_or_none(paths: list[str]) -> list[float | None]:
+    return list(map(_mtime_or_none, paths))
+
+
+async def _stat_mtimes(paths: list[str]) -> dict[str, float]:
+    """
+    Returns {path: mtime} for `paths`, dropping files that vanished. Large
+    batches are split across the shared stat pool since the GIL is released
+    during the syscall, which helps on high-latency filesystems.
+    """
+    if len(paths) < PARALLEL_STAT_THRESHOLD:
+        results = await asyncio.to_thread(_mtimes_or_none, paths)
+    else:
+        loop = asyncio.get_running_loop()
+        pool = _get_stat_executor()
+        size = -(-len(paths) // MAX_STAT_WORKERS)
+        chunks = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    pool, _mtimes_or_none, paths[i : i + size]
+                )
+                for i in range(0, len(paths), size)
+            )
+        )
+        results = [mtime for chunk in chunks for mtime in chunk]
+    return {
+        p: mtime
+        for p, mtime in zip(paths, results, strict=True)
+        if mtime is not None
+    }
+
 
 class GlobToolParams(BaseModel):
     pattern: str = Field(
@@ -38,7 +205,7 @@ class GlobTool(BaseTool[GlobToolParams, ToolResult]):
             name=self.NAME,
             display_name="FindFiles",
             description="Efficiently finds files matching specific glob patterns.",
-            parameter_schema=GlobToolParams.model_json_schema(),
+            parameter_schema=params_schema(GlobToolParams),
         )
         self.config = config
         self.root_directory = Path(config.get_target_dir()).resolve()
@@ -51,6 +218,10 @@ class GlobTool(BaseTool[GlobToolParams, ToolResult]):
             return "Search path does not exist or is not a directory."
         if not params.pattern:
             return "The 'pattern' parameter cannot be empty."
+        try:
+            _compile_rglob(params.pattern, params.case_sensitive)
+        except ValueError as e:
+            return str(e)
         return None
 
     def get_description(self, params: GlobToolParams) -> str:
@@ -58,6 +229,57 @@ class GlobTool(BaseTool[GlobToolParams, ToolResult]):
         relative_path = make_relative(search_dir, self.root_directory)
         return f"'{params.pattern}' within {shorten_path(str(relative_path))}"
 
+    async def _walk(
+        self,
+        search_dir: Path,
+        regex: re.Pattern[str],
+        respect_git_ignore: bool,
+    ) -> tuple[list[str], int]:
+        """Runs _find_matches under `search_dir` in a worker thread."""
+        is_ignored = None
+        ignore_prefix = ""
+        if respect_git_ignore:
+            file_discovery = self.config.get_file_service()
+            is_ignored = file_discovery.get_git_ignore_matcher()
+            # Ignore rules are relative to the project root, as in
+            # FileDiscoveryService.filter_files.
+            search_path = Path(os.path.normpath(search_dir))
+            try:
+                rel = search_path.relative_to(file_discovery.project_root)
+                ignore_prefix = "" if rel == Path() else f"{rel}/"
+            except ValueError:
+                ignore_prefix = f"{search_path}/"
+        return await asyncio.to_thread(
+            _find_matches, str(search_dir), regex, is_ignored, ignore_prefix
+        )
+
+    async def find_files(
+        self,
+        patterns: list[str],
+        respect_git_ignore: bool = True,
+        case_sensitive: bool = False,
+    ) -> list[str]:
+        """
+        Returns the sorted absolute paths under the root directory matching
+        any of `patterns`. All patterns share a single walk. Raises
+        ValueError for patterns that _compile_rglob rejects.
+        """
+        if not patterns:
+            return []
+        regex = re.compile(
+            "|".join(
+                f"(?:{_compile_rglob(p, case_sensitive).pattern})"
+                for p in patterns
+            ),
+            0 if case_sensitive else re.IGNORECASE,
+        )
+        matches, _ = await self._walk(
+            self.root_directory, regex, respect_git_ignore
+        )
+        # scandir order depends on the filesystem; sort for stable output.
+        matches.sort()
+        return matches
+
     async def execute(
         self, params: GlobToolParams, signal: Any | None = None
     ) -> ToolResult:
@@ -69,22 +291,15 @@ class GlobTool(BaseTool[GlobToolParams, ToolResult]):
             )
 
         search_dir = self.root_directory.joinpath(params.path)
-        # Python's glob is case-sensitive on Linux/macOS by default, case-insensitive on Windows.
-        # The `case_sensitive` parameter from JS is complex to replicate cross-platform.
-        # We will use the default behavior of `rglob`.
-        all_found = list(search_dir.rglob(params.pattern))
-
-        file_discovery = self.config.get_file_service()
-
-        absolute_paths = [str(p) for p in all_found if p.is_file()]
-
-        filtered_paths = absolute_paths
-        git_ignored_count = 0
-        if params.respect_git_ignore:
-            filtered_paths = file_discovery.filter_files(
-                absolute_paths, respect_gemini_ignore=False
-            )
-            git_ignored_count = len(absolute_paths) - len(filtered_paths)
+        # Ignored directories are pruned during the walk, so files under them
+        # are neither visited nor counted in git_ignored_count.
+        matches, git_ignored_count = await self._walk(
+            search_dir,
+            _compile_rglob(params.pattern, params.case_sensitive),
+            params.respect_git_ignore,
+        )
+        mtimes = await _stat_mtimes(matches)
+        filtered_paths = list(mtimes)
 
         if not filtered_paths:
             return ToolResult(
@@ -92,20 +307,9 @@ class GlobTool(BaseTool[GlobToolParams, ToolResult]):
             )
 
         # Sort by modification time
-        try:
-            sorted_paths = sorted(
-                filtered_paths,
-                key=lambda p: Path(p).stat().st_mtime,
-                reverse=True,
-            )
-        except FileNotFoundError:
-            # A file might be deleted between glob and stat, filter it out.
-            existing_paths = [p for p in filtered_paths if Path(p).exists()]
-            sorted_paths = sorted(
-                existing_paths,
-                key=lambda p: Path(p).stat().st_mtime,
-                reverse=True,
-            )
+        sorted_paths = sorted(
+            filtered_paths, key=mtimes.__getitem__, reverse=True
+        )
 
         file_list_str = "\n".join(sorted_paths)
         result_message = f"Found {len(sorted_paths)} file(s):\n{file_list_str}"
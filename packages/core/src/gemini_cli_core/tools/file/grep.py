@@ -6,7 +6,7 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 from gemini_cli_core.core.config import Config
-from gemini_cli_core.tools import BaseTool, ToolResult
+from gemini_cli_core.tools import BaseTool, ToolResult, params_schema
 from gemini_cli_core.utils.git_utils import is_git_repository
 
 
@@ -85,7 +85,7 @@ class GrepTool(BaseTool[GrepToolParams, ToolResult]):
             name=self.NAME,
             display_name="SearchText",
             description="Searches for a regular expression pattern within files.",
-            parameter_schema=GrepToolParams.model_json_schema(),
+            parameter_schema=params_schema(GrepToolParams),
         )
         self.root_directory = Path(config.get_target_dir()).resolve()
 
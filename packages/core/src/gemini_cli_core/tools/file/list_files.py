@@ -4,7 +4,7 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 from gemini_cli_core.core.config import Config
-from gemini_cli_core.tools import BaseTool, ToolResult
+from gemini_cli_core.tools import BaseTool, ToolResult, params_schema
 from gemini_cli_core.utils.paths import make_relative, shorten_path
 
 
@@ -36,7 +36,7 @@ class LSTool(BaseTool[LSToolParams, ToolResult]):
             name=self.NAME,
             display_name="ReadFolder",
             description="Lists the names of files and subdirectories directly within a specified directory path.",
-            parameter_schema=LSToolParams.model_json_schema(),
+            parameter_schema=params_schema(LSToolParams),
         )
         self.config = config
         self.root_directory = Path(config.get_target_dir()).resolve()
@@ -1,15 +1,17 @@
 import mimetypes
+import os
+import stat
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 from gemini_cli_core.core.config import Config
-from gemini_cli_core.tools import BaseTool, ToolResult
+from gemini_cli_core.tools import BaseTool, ToolResult, params_schema
+from gemini_cli_core.utils.file_utils import encode_base64_stream
 from gemini_cli_core.utils.paths import (
     is_within_root,
-    make_relative,
-    shorten_path,
+    resolve_tool_path,
 )
 
 
@@ -29,38 +31,102 @@ class ReadFileToolParams(BaseModel):
     )
 
 
+# Files truncated for the LLM when no explicit offset/limit is given.
+_MAX_LINES_WITHOUT_LIMIT = 2000
+
+
+def _line_offset(raw: bytes, lines: int, start: int = 0) -> int:
+    """Returns the byte offset `lines` lines after `start` (capped at EOF)."""
+    pos = start
+    for _ in range(lines):
+        pos = raw.find(b"\n", pos)
+        if pos == -1:
+            return len(raw)
+        pos += 1
+    return pos
+
+
+def _normalize_newlines(raw: bytes) -> bytes:
+    """
+    Applies the newline translation text-mode reads apply. Safe on UTF-8
+    bytes: 0x0D never occurs inside a multi-byte sequence.
+    """
+    if b"\r" in raw:
+        raw = raw.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return raw
+
+
 def _process_text_content(
-    content: str, offset: int | None, limit: int | None
+    raw: bytes, offset: int | None, limit: int | None
 ) -> tuple[str, str]:
-    """Processes text content, applying offset and limit."""
-    lines = content.splitlines()
-    total_lines = len(lines)
+    """
+    Processes text content, applying offset and limit. Line boundaries are
+    located on the raw bytes so only the returned slice is decoded.
+    """
+    # Normalize first so CR-only and CRLF files are counted and sliced on
+    # the same line boundaries text mode would use.
+    raw = _normalize_newlines(raw)
+    total_lines = raw.count(b"\n")
+    if raw and not raw.endswith(b"\n"):
+        total_lines += 1
 
     if offset is not None and limit is not None:
         start = offset
         end = offset + limit
-        content_slice = "\n".join(lines[start:end])
+        begin = _line_offset(raw, start)
+        stop = _line_offset(raw, limit, begin)
+        content_slice = raw[begin:stop].removesuffix(b"\n").decode("utf-8")
         display = f"Read lines {start + 1}-{min(end, total_lines)} of {total_lines} from"
         return content_slice, display
 
     # Simple heuristic to truncate very large files for the LLM
-    if total_lines > 2000:
-        content = "\n".join(lines[:2000]) + "\n... (file truncated)"
+    if total_lines > _MAX_LINES_WITHOUT_LIMIT:
+        stop = _line_offset(raw, _MAX_LINES_WITHOUT_LIMIT)
+        content = (
+            raw[:stop].removesuffix(b"\n").decode("utf-8")
+            + "\n... (file truncated)"
+        )
+    else:
+        content = raw.decode("utf-8")
 
     display = f"Read {total_lines} lines from"
     return content, display
 
 
-def _process_binary_content(file_path: Path) -> tuple[dict, str]:
-    """Processes binary content (images, etc.) into a data URI."""
-    mime_type, _ = mimetypes.guess_type(file_path)
-    if not mime_type:
-        mime_type = "application/octet-stream"
+# Fixed file signatures for the binary formats we commonly inline.
+_MAGIC_SIGNATURES: tuple[tuple[bytes, str], ...] = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"%PDF-", "application/pdf"),
+)
+_SNIFF_BYTES = 16
+
 
+def _sniff_mime_type(head: bytes) -> str | None:
+    """Detects a MIME type from the first bytes of a file."""
+    for signature, mime_type in _MAGIC_SIGNATURES:
+        if head.startswith(signature):
+            return mime_type
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+def _process_binary_content(
+    file_path: Path, mime_type: str | None = None
+) -> tuple[dict, str]:
+    """Processes binary content (images, etc.) into a data URI."""
     with file_path.open("rb") as f:
-        import base64
+        if not mime_type:
+            mime_type = _sniff_mime_type(f.peek(_SNIFF_BYTES)[:_SNIFF_BYTES])
+        encoded_content = encode_base64_stream(f, os.fstat(f.fileno()).st_size)
 
-        encoded_content = base64.b64encode(f.read()).decode("utf-8")
+    if not mime_type:
+        mime_type, _ = mimetypes.guess_type(file_path.name)
+    if not mime_type:
+        mime_type = "application/octet-stream"
 
     llm_content = {
         "inlineData": {"mimeType": mime_type, "data": encoded_content}
@@ -79,13 +145,15 @@ class ReadFileTool(BaseTool[ReadFileToolParams, ToolResult]):
             name=self.NAME,
             display_name="ReadFile",
             description="Reads and returns the content of a specified file. Handles both text and binary files.",
-            parameter_schema=ReadFileToolParams.model_json_schema(),
+            parameter_schema=params_schema(ReadFileToolParams),
         )
         self.config = config
         self.root_directory = Path(config.get_target_dir()).resolve()
 
     def validate_tool_params(self, params: ReadFileToolParams) -> str | None:
-        p = Path(params.absolute_path)
+        p, relative_path, short_path = resolve_tool_path(
+            params.absolute_path, self.root_directory
+        )
         if not p.is_absolute():
             return f"File path must be absolute: {params.absolute_path}"
         if not is_within_root(p, self.root_directory):
@@ -96,17 +164,16 @@ class ReadFileTool(BaseTool[ReadFileToolParams, ToolResult]):
             return "Limit must be a positive number"
 
         file_discovery = self.config.get_file_service()
-        relative_path = make_relative(p, self.root_directory)
-        if file_discovery.should_gemini_ignore_file(str(relative_path)):
-            return f"File path '{shorten_path(relative_path)}' is ignored by .geminiignore."
+        if file_discovery.should_gemini_ignore_file(relative_path):
+            return f"File path '{short_path}' is ignored by .geminiignore."
 
         return None
 
     def get_description(self, params: ReadFileToolParams) -> str:
-        relative_path = make_relative(
-            Path(params.absolute_path), self.root_directory
+        _, _, short_path = resolve_tool_path(
+            params.absolute_path, self.root_directory
         )
-        return shorten_path(relative_path)
+        return short_path
 
     async def execute(
         self, params: ReadFileToolParams, signal: Any | None = None
@@ -118,14 +185,18 @@ class ReadFileTool(BaseTool[ReadFileToolParams, ToolResult]):
                 return_display=f"Error: {validation_error}",
             )
 
-        file_path = Path(params.absolute_path)
+        file_path, _, short_path = resolve_tool_path(
+            params.absolute_path, self.root_directory
+        )
         try:
-            if not file_path.exists():
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
                 return ToolResult(
                     llm_content="Error: File not found.",
                     return_display="Error: File not found.",
                 )
-            if file_path.is_dir():
+            if stat.S_ISDIR(st.st_mode):
                 return ToolResult(
                     llm_content="Error: Path is a directory.",
                     return_display="Error: Path is a directory.",
@@ -133,22 +204,29 @@ class ReadFileTool(BaseTool[ReadFileToolParams, ToolResult]):
 
             llm_content: Any
             display_message: str
-            try:
-                # Try reading as text first
-                with file_path.open("r", encoding="utf-8") as f:
-                    content = f.read()
-                llm_content, display_message = _process_text_content(
-                    content, params.offset, params.limit
-                )
-            except UnicodeDecodeError:
+            with file_path.open("rb") as f:
+                head = f.read(_SNIFF_BYTES)
+                mime_type = _sniff_mime_type(head)
+                # Known binary signatures skip the text attempt entirely.
+                raw = None if mime_type else head + f.read()
+
+            text_result = None
+            if raw is not None and b"\0" not in raw[:4096]:
+                try:
+                    text_result = _process_text_content(
+                        raw, params.offset, params.limit
+                    )
+                except UnicodeDecodeError:
+                    pass
+
+            if text_result is not None:
+                llm_content, display_message = text_result
+            else:
                 # Fallback to binary reading
                 llm_content, display_message = _process_binary_content(
-                    file_path
+                    file_path, mime_type
                 )
 
-            short_path = shorten_path(
-                make_relative(file_path, self.root_directory)
-            )
             return ToolResult(
                 llm_content=llm_content,
                 return_display=f"{display_message} '{short_path}'",
@@ -1,15 +1,22 @@
+import asyncio
+import io
+import os
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 from gemini_cli_core.core.config import Config
-from gemini_cli_core.tools import BaseTool, ToolResult
+from gemini_cli_core.tools import BaseTool, ToolResult, params_schema
 from gemini_cli_core.tools.file.glob import GlobTool
 from gemini_cli_core.utils.file_utils import (
     process_single_file_content,
 )
-from gemini_cli_core.utils.paths import make_relative
+
+MAX_CONCURRENT_FILE_READS = 32
+# Reads are scheduled in batches so a huge match list does not create a
+# task per file up front.
+READ_BATCH_SIZE = 1024
 
 
 class ReadManyFilesParams(BaseModel):
@@ -31,33 +38,26 @@ class ReadManyFilesTool(BaseTool[ReadManyFilesParams, ToolResult]):
             name=self.NAME,
             display_name="ReadManyFiles",
             description="Reads content from multiple files specified by glob patterns.",
-            parameter_schema=ReadManyFilesParams.model_json_schema(),
+            parameter_schema=params_schema(ReadManyFilesParams),
         )
         self.config = config
         self.root_directory = Path(config.get_target_dir()).resolve()
+        # find_files returns paths under the root, so the header is a slice.
+        self._root_prefix = os.path.join(self.root_directory, "")
         self.glob_tool = GlobTool(config)
 
     async def execute(
         self, params: ReadManyFilesParams, signal: Any | None = None
     ) -> ToolResult:
-        # Use the GlobTool to find the files
-        glob_params = self.glob_tool.params(
-            pattern=",".join(params.paths),  # A bit of a hack for the pattern
-            respect_git_ignore=params.respect_git_ignore,
-        )
-        glob_result = await self.glob_tool.execute(glob_params, signal)
-
-        if (
-            "Error" in glob_result.return_display
-            or "not found" in glob_result.return_display
-        ):
-            return glob_result
-
-        file_paths_str = glob_result.llm_content.splitlines()
-        # The first line is the count message, so skip it
-        file_paths = [
-            path_str for path_str in file_paths_str[1:] if path_str.strip()
-        ]
+        try:
+            file_paths = await self.glob_tool.find_files(
+                params.paths, respect_git_ignore=params.respect_git_ignore
+            )
+        except ValueError as e:
+            return ToolResult(
+                llm_content=f"Error: Invalid parameters. Reason: {e}",
+                return_display=str(e),
+            )
 
         if not file_paths:
             return ToolResult(
@@ -65,38 +65,61 @@ class ReadManyFilesTool(BaseTool[ReadManyFilesParams, ToolResult]):
                 return_display="No files found.",
             )
 
-        content_parts = []
+        # Text is accumulated in one buffer; binary parts (images, PDFs) are
+        # dicts, so when one appears the pending text becomes its own part.
+        text_buffer = io.StringIO()
+        content_parts: list[dict[str, Any]] = []
         processed_files = []
         skipped_files = []
 
-        for file_path_str in file_paths:
-            file_path = Path(file_path_str)
-            read_result = await process_single_file_content(
-                file_path, self.root_directory
-            )
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FILE_READS)
+
+        async def read(file_path: Path):
+            async with semaphore:
+                return await process_single_file_content(
+                    file_path, self.root_directory
+                )
 
+        results = []
+        for start in range(0, len(file_paths), READ_BATCH_SIZE):
+            batch = file_paths[start : start + READ_BATCH_SIZE]
+            results += await asyncio.gather(*(read(Path(p)) for p in batch))
+
+        # gather keeps the input order, so output follows the walk order.
+        for file_path_str, read_result in zip(
+            file_paths, results, strict=True
+        ):
             if read_result.error:
                 skipped_files.append(
                     {"path": file_path_str, "reason": read_result.error}
                 )
             else:
-                separator = f"--- {make_relative(file_path, self.root_directory)} ---\n\n"
+                relative_path = file_path_str.removeprefix(self._root_prefix)
+                text_buffer.write(f"--- {relative_path} ---\n\n")
                 if isinstance(read_result.llm_content, str):
-                    content_parts.append(
-                        separator + read_result.llm_content + "\n\n"
-                    )
+                    text_buffer.write(read_result.llm_content)
+                    text_buffer.write("\n\n")
                 else:  # It's a dict for binary content
-                    content_parts.append(separator)
+                    content_parts.append({"text": text_buffer.getvalue()})
+                    text_buffer = io.StringIO()
                     content_parts.append(read_result.llm_content)
                 processed_files.append(file_path_str)
 
-        if not content_parts:
+        if not processed_files:
             return ToolResult(
                 llm_content="All found files were skipped due to read errors.",
                 return_display="All found files were skipped.",
             )
 
+        text = text_buffer.getvalue()
+        if content_parts:
+            if text:
+                content_parts.append({"text": text})
+            llm_content: Any = content_parts
+        else:
+            llm_content = text
+
         return ToolResult(
-            llm_content="".join(content_parts),
+            llm_content=llm_content,
             return_display=f"Read content from {len(processed_files)} file(s).",
         )
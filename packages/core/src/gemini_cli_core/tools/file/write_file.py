@@ -1,4 +1,7 @@
-import difflib
+import asyncio
+import os
+import stat
+from collections import Counter
 from pathlib import Path
 from typing import Any
 
@@ -6,14 +9,13 @@ from pydantic import BaseModel, Field
 
 from gemini_cli_core.core.config import Config
 from gemini_cli_core.core.types import ApprovalMode
-from gemini_cli_core.tools import BaseTool, ToolResult
+from gemini_cli_core.tools import BaseTool, ToolResult, params_schema
 from gemini_cli_core.tools.common import ToolEditConfirmationDetails
-from gemini_cli_core.tools.file.diff_options import DEFAULT_DIFF_CONTEXT_LINES
+from gemini_cli_core.tools.file.diff_options import unified_diff_text
 from gemini_cli_core.utils.edit_corrector import ensure_correct_file_content
 from gemini_cli_core.utils.paths import (
     is_within_root,
-    make_relative,
-    shorten_path,
+    resolve_tool_path,
 )
 
 from ..base.modifiable_tool import (
@@ -21,6 +23,31 @@ from ..base.modifiable_tool import (
     ModifyContext,
 )
 
+# Above this size (in characters, old + new) a line-level diff is too slow to
+# be worth computing, so only a summary of added/removed lines is shown.
+MAX_DIFF_CONTENT_SIZE = 1024 * 1024
+
+
+def _unified_diff(
+    original_content: str, new_content: str, fromfile: str, tofile: str
+) -> str:
+    """Builds a unified diff, or a line-count summary for very large files."""
+    old_lines = original_content.splitlines(keepends=True)
+    new_lines = new_content.splitlines(keepends=True)
+
+    if len(original_content) + len(new_content) > MAX_DIFF_CONTENT_SIZE:
+        old_counts = Counter(old_lines)
+        new_counts = Counter(new_lines)
+        added = (new_counts - old_counts).total()
+        removed = (old_counts - new_counts).total()
+        return (
+            f"--- {fromfile}\n+++ {tofile}\n"
+            f"File replaced (diff suppressed, {added} lines added / "
+            f"{removed} removed)\n"
+        )
+
+    return unified_diff_text(old_lines, new_lines, fromfile, tofile)
+
 
 class WriteFileToolParams(BaseModel):
     file_path: str = Field(
@@ -43,7 +70,7 @@ class WriteFileTool(
             name=self.NAME,
             display_name="WriteFile",
             description="Writes content to a specified file in the local filesystem.",
-            parameter_schema=WriteFileToolParams.model_json_schema(),
+            parameter_schema=params_schema(WriteFileToolParams),
         )
         self.config = config
         self.client = config.get_gemini_client()
@@ -53,29 +80,34 @@ class WriteFileTool(
         return is_within_root(p, self.root_directory)
 
     def validate_tool_params(self, params: WriteFileToolParams) -> str | None:
-        p = Path(params.file_path)
+        p, _, _ = resolve_tool_path(params.file_path, self.root_directory)
         if not p.is_absolute():
             return f"File path must be absolute: {params.file_path}"
         if not self._is_within_root(p):
             return f"Path must be within the root directory ({self.root_directory}): {params.file_path}"
-        if p.exists() and p.is_dir():
+        if p.is_dir():
             return f"Path is a directory, not a file: {params.file_path}"
         return None
 
     def get_description(self, params: WriteFileToolParams) -> str:
-        relative_path = make_relative(
-            Path(params.file_path), self.root_directory
+        _, _, short_path = resolve_tool_path(
+            params.file_path, self.root_directory
         )
-        return f"Writing to {shorten_path(relative_path)}"
+        return f"Writing to {short_path}"
+
+    def _read_original_content(self, file_path: Path) -> tuple[str, bool]:
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            return "", False
+        if not stat.S_ISREG(st.st_mode):
+            return "", False
+        return file_path.read_text(encoding="utf-8"), True
 
     async def _get_corrected_content(
         self, file_path: Path, proposed_content: str
     ) -> tuple[str, str, bool]:
-        original_content = ""
-        file_exists = False
-        if file_path.exists() and file_path.is_file():
-            original_content = file_path.read_text(encoding="utf-8")
-            file_exists = True
+        original_content, file_exists = self._read_original_content(file_path)
 
         # TODO: Implement ensureCorrectEdit logic for existing files if needed
         corrected_content = await ensure_correct_file_content(
@@ -93,27 +125,27 @@ class WriteFileTool(
         if validation_error:
             return False
 
+        file_path, _, short_path = resolve_tool_path(
+            params.file_path, self.root_directory
+        )
         (
             original_content,
             corrected_content,
             _,
-        ) = await self._get_corrected_content(
-            Path(params.file_path), params.content
-        )
+        ) = await self._get_corrected_content(file_path, params.content)
 
-        diff = "".join(
-            difflib.unified_diff(
-                original_content.splitlines(keepends=True),
-                corrected_content.splitlines(keepends=True),
-                fromfile=f"Original: {params.file_path}",
-                tofile=f"Proposed: {params.file_path}",
-                n=DEFAULT_DIFF_CONTEXT_LINES,
-            )
+        # difflib is pure Python; keep it off the event loop.
+        diff = await asyncio.to_thread(
+            _unified_diff,
+            original_content,
+            corrected_content,
+            f"Original: {params.file_path}",
+            f"Proposed: {params.file_path}",
         )
 
         return ToolEditConfirmationDetails(
-            title=f"Confirm write to: {shorten_path(make_relative(Path(params.file_path), self.root_directory))}",
-            file_name=Path(params.file_path).name,
+            title=f"Confirm write to: {short_path}",
+            file_name=file_path.name,
             file_diff=diff,
         )
 
@@ -127,25 +159,36 @@ class WriteFileTool(
                 return_display=f"Error: {validation_error}",
             )
 
-        file_path = Path(params.file_path)
+        file_path, _, _ = resolve_tool_path(
+            params.file_path, self.root_directory
+        )
         try:
+            # The same corrected content that was shown for confirmation.
             (
                 original_content,
                 corrected_content,
-                is_new_file,
+                file_exists,
             ) = await self._get_corrected_content(file_path, params.content)
 
+            # Nothing to write (or diff) if the file already has the content.
+            if file_exists and original_content == corrected_content:
+                return ToolResult(
+                    llm_content=f"No changes: {params.file_path} already matches proposed content.",
+                    return_display={
+                        "file_diff": "",
+                        "file_name": file_path.name,
+                    },
+                )
+
             file_path.parent.mkdir(parents=True, exist_ok=True)
             file_path.write_text(corrected_content, encoding="utf-8")
 
-            diff = "".join(
-                difflib.unified_diff(
-                    original_content.splitlines(keepends=True),
-                    corrected_content.splitlines(keepends=True),
-                    fromfile=f"Original: {file_path.name}",
-                    tofile=f"Written: {file_path.name}",
-                    n=DEFAULT_DIFF_CONTEXT_LINES,
-                )
+            diff = await asyncio.to_thread(
+                _unified_diff,
+                original_content,
+                corrected_content,
+                f"Original: {file_path.name}",
+                f"Written: {file_path.name}",
             )
 
             return ToolResult(
@@ -37,20 +37,29 @@ StatusChangeListener = Callable[[str, MCPServerStatus], None]
 
 
 class MCPStatusManager:
+    __slots__ = ("discovery_state", "listeners", "server_statuses")
+
     def __init__(self):
         self.server_statuses: dict[str, MCPServerStatus] = {}
         self.discovery_state: MCPDiscoveryState = MCPDiscoveryState.NOT_STARTED
-        self.listeners: list[StatusChangeListener] = []
+        # Listeners change rarely but are iterated on every status update,
+        # so they are kept in an immutable tuple that is swapped on change.
+        self.listeners: tuple[StatusChangeListener, ...] = ()
 
     def add_listener(self, listener: StatusChangeListener):
-        self.listeners.append(listener)
+        self.listeners = (*self.listeners, listener)
 
     def remove_listener(self, listener: StatusChangeListener):
-        self.listeners.remove(listener)
+        listeners = list(self.listeners)
+        listeners.remove(listener)
+        self.listeners = tuple(listeners)
 
     def update_status(self, server_name: str, status: MCPServerStatus):
         self.server_statuses[server_name] = status
-        for listener in self.listeners:
+        listeners = self.listeners
+        if not listeners:
+            return
+        for listener in listeners:
             listener(server_name, status)
 
     def get_status(self, server_name: str) -> MCPServerStatus:
@@ -122,6 +131,10 @@ async def _discover_with_session(
         status_manager.update_status(server_name, MCPServerStatus.CONNECTED)
 
         tools_response = await session.list_tools()
+        # Check name collisions against a local snapshot, then register the
+        # whole batch at once.
+        taken_names = tool_registry.get_tool_names()
+        pending: list[DiscoveredMCPTool] = []
         for tool_def in tools_response.tools:
             # MCP Python SDK uses `inputSchema`
             parameter_schema = tool_def.input_schema or {
@@ -136,7 +149,7 @@ async def _discover_with_session(
                     r"[^a-zA-Z0-9_.-]", "_", tool_name_for_model
                 )
 
-            if tool_registry.get_tool(tool_name_for_model):
+            if tool_name_for_model in taken_names:
                 tool_name_for_model = f"{server_name}__{tool_name_for_model}"
 
             if len(tool_name_for_model) > 63:
@@ -144,7 +157,8 @@ async def _discover_with_session(
                     tool_name_for_model[:28] + "___" + tool_name_for_model[-32:]
                 )
 
-            tool_registry.register_tool(
+            taken_names.add(tool_name_for_model)
+            pending.append(
                 DiscoveredMCPTool(
                     mcp_session=session,
                     server_name=server_name,
@@ -157,6 +171,8 @@ async def _discover_with_session(
                 )
             )
 
+        tool_registry.register_many(pending)
+
 
 async def discover_mcp_tools(
     mcp_servers: dict[str, MCPServerConfig], tool_registry: ToolRegistry
@@ -1,4 +1,3 @@
-import json
 from typing import Any, ClassVar
 
 from mcp import ClientSession
@@ -9,6 +8,7 @@ from gemini_cli_core.tools.common import (
     ToolCallConfirmationDetails,
     ToolMcpConfirmationDetails,
 )
+from gemini_cli_core.utils.json_utils import dumps_indented
 
 
 class DiscoveredMCPToolParams(BaseModel):
@@ -72,13 +72,23 @@ class DiscoveredMCPTool(BaseTool[DiscoveredMCPToolParams, ToolResult]):
 
     async def execute(
         self,
-        params: DiscoveredMCPToolParams,
+        params: DiscoveredMCPToolParams | dict[str, Any],
         signal: Any | None = None,
         **kwargs,
     ) -> ToolResult:
+        # The params model declares no fields, so with extra="allow" every
+        # argument already lives in `model_extra`. Forward it (or the raw
+        # dict from the scheduler) as-is instead of re-serializing.
+        if isinstance(params, dict):
+            arguments = params
+        elif params.model_extra is not None:
+            arguments = params.model_extra
+        else:
+            arguments = params.model_dump()
+
         tool_result = await self.mcp_session.call_tool(
             name=self.server_tool_name,
-            arguments=params.model_dump(),
+            arguments=arguments,
         )
 
         # The result from the Python SDK might be a dict or a tuple
@@ -99,6 +109,6 @@ class DiscoveredMCPTool(BaseTool[DiscoveredMCPToolParams, ToolResult]):
 
         # Simplified version of the JS logic.
         try:
-            return f"```json\n{json.dumps(result, indent=2)}\n```"
+            return f"```json\n{dumps_indented(result)}\n```"
         except TypeError:
             return str(result)
@@ -1,15 +1,22 @@
+import re
 from pathlib import Path
 from typing import Any
 
 import aiofiles
 from pydantic import BaseModel, Field
 
-from gemini_cli_core.tools import BaseTool, ToolResult
+from gemini_cli_core.tools import BaseTool, ToolResult, params_schema
 
 GEMINI_CONFIG_DIR = Path.home() / ".gemini"
 DEFAULT_CONTEXT_FILENAME = "GEMINI.md"
 MEMORY_SECTION_HEADER = "## Gemini Added Memories"
 
+_MEMORY_SECTION_HEADER_BYTES = MEMORY_SECTION_HEADER.encode("utf-8")
+_NEXT_SECTION = re.compile(rb"\n## ")
+# How much of the end of the memory file is inspected to decide whether a
+# new entry can simply be appended.
+_TAIL_SCAN_BYTES = 4096
+
 
 class SaveMemoryParams(BaseModel):
     fact: str = Field(..., description="The specific fact to remember.")
@@ -31,17 +38,52 @@ def ensure_newline_separation(content: str) -> str:
     return "\n\n"
 
 
+async def _try_append_memory_entry(
+    memory_file_path: Path, new_memory_item: str
+) -> bool:
+    """
+    Appends the entry in place when the memory section is the last section
+    of the file. Returns False if a full rewrite is required instead.
+    """
+    try:
+        async with aiofiles.open(memory_file_path, "rb") as f:
+            size = await f.seek(0, 2)
+            await f.seek(max(size - _TAIL_SCAN_BYTES, 0))
+            tail = await f.read()
+    except FileNotFoundError:
+        return False
+
+    header_index = tail.rfind(_MEMORY_SECTION_HEADER_BYTES)
+    if header_index == -1:
+        return False
+    section_start = header_index + len(_MEMORY_SECTION_HEADER_BYTES)
+    if _NEXT_SECTION.search(tail, section_start):
+        return False
+    # Only a single trailing newline matches what the rewrite path produces.
+    if not tail.endswith(b"\n") or tail.endswith(b"\n\n"):
+        return False
+
+    async with aiofiles.open(memory_file_path, "ab") as f:
+        await f.write(f"{new_memory_item}\n".encode())
+    return True
+
+
 async def perform_add_memory_entry(text: str, memory_file_path: Path):
     """Adds a new memory entry to the specified memory file."""
     processed_text = text.strip().lstrip("-").strip()
     new_memory_item = f"- {processed_text}"
 
-    await memory_file_path.parent.mkdir(parents=True, exist_ok=True)
+    memory_file_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if await _try_append_memory_entry(memory_file_path, new_memory_item):
+        return
 
     content = ""
-    if await aiofiles.os.path.exists(memory_file_path):
+    try:
         async with aiofiles.open(memory_file_path, encoding="utf-8") as f:
             content = await f.read()
+    except FileNotFoundError:
+        pass
 
     header_index = content.find(MEMORY_SECTION_HEADER)
 
@@ -79,7 +121,7 @@ class MemoryTool(BaseTool[SaveMemoryParams, ToolResult]):
             name=self.NAME,
             display_name="Save Memory",
             description="Saves a specific piece of information to long-term memory.",
-            parameter_schema=SaveMemoryParams.model_json_schema(),
+            parameter_schema=params_schema(SaveMemoryParams),
         )
 
     async def execute(
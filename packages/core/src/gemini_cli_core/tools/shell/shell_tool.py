@@ -1,17 +1,78 @@
 import asyncio
+import codecs
 import os
+import re
 import shlex
+import shutil
+from collections import deque
 from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
+from signal import SIGKILL
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 from gemini_cli_core.core.config import Config
-from gemini_cli_core.tools import BaseTool, ToolResult
+from gemini_cli_core.tools import BaseTool, ToolResult, params_schema
 from gemini_cli_core.tools.common import ToolCallConfirmationDetails
 from gemini_cli_core.utils.paths import is_within_root
 
+# Bytes requested per read from the subprocess pipes.
+READ_CHUNK_SIZE = 64 * 1024
+COMMAND_TIMEOUT_SECONDS = 300
+# Only the tail of a command's output is kept for the LLM.
+MAX_OUTPUT_BYTES = 256 * 1024
+
+# Command substitution is rejected; all forbidden tokens live in one
+# alternation so a command is scanned once.
+_DISALLOWED = re.compile(r"`|\$\(")
+
+# Anything that needs a shell to interpret: pipes, redirection, command
+# lists, subshells, expansions, globs and comments.
+_SHELL_SYNTAX = re.compile(r"[|&;<>()$`*?\[\]{}~#\n]")
+
+
+# POSIX special and regular builtins (plus common shell-only commands).
+# Several also exist under /usr/bin, but those binaries behave differently
+# (e.g. /usr/bin/echo vs dash's echo on backslash escapes) or cannot affect
+# the shell at all, so these always run through the shell.
+_SHELL_BUILTINS = frozenset(
+    {
+        ".", ":", "alias", "bg", "break", "cd", "command", "continue",
+        "echo", "eval", "exec", "exit", "export", "false", "fc", "fg",
+        "getopts", "hash", "jobs", "kill", "printf", "pwd", "read",
+        "readonly", "return", "set", "shift", "source", "test", "times",
+        "trap", "true", "type", "ulimit", "umask", "unalias", "unset", "wait",
+    }
+)
+
+
+@lru_cache(maxsize=128)
+def _split_command(command: str) -> tuple[str, ...]:
+    """Tokenizes a command once; raises ValueError on unbalanced quotes."""
+    return tuple(shlex.split(command))
+
+
+@lru_cache(maxsize=128)
+def _check_command(command: str) -> str | None:
+    """
+    Validates the command string itself. should_confirm_execute and
+    execute check the same command back to back, so this is memoized;
+    it only depends on the string, unlike the directory check.
+    """
+    if _DISALLOWED.search(command) is not None:
+        return f"Command is not allowed: {command}"
+    if not command.strip():
+        return "Command cannot be empty."
+    try:
+        tokens = _split_command(command)
+    except ValueError:
+        tokens = ()
+    if not tokens or not tokens[0]:
+        return "Could not identify command root."
+    return None
+
 
 class ShellToolParams(BaseModel):
     command: str = Field(..., description="Exact bash command to execute.")
@@ -33,38 +94,56 @@ class ShellTool(BaseTool[ShellToolParams, ToolResult]):
             name=self.NAME,
             display_name="Shell",
             description="Executes a shell command.",
-            parameter_schema=ShellToolParams.model_json_schema(),
+            parameter_schema=params_schema(ShellToolParams),
             is_output_markdown=False,
             can_update_output=True,
         )
         self.config = config
         self.whitelist: set[str] = set()
+        self._root = Path(config.get_target_dir()).resolve()
 
     def get_command_root(self, command: str) -> str | None:
         try:
-            return shlex.split(command)[0]
+            tokens = _split_command(command)
         except ValueError:
             return None
+        return tokens[0] if tokens else None
+
+    def _get_exec_args(self, command: str) -> tuple[str, ...] | None:
+        """
+        Returns the argv for running a command without a shell, or None if
+        the command relies on shell syntax, a variable assignment or a shell
+        builtin.
+        """
+        if _SHELL_SYNTAX.search(command):
+            return None
+        try:
+            tokens = _split_command(command)
+        except ValueError:
+            return None
+        if not tokens or "=" in tokens[0]:
+            return None
+        root = tokens[0]
+        # Relative paths like ./script.sh resolve against the command's cwd,
+        # which `which` cannot check.
+        if "/" in root and not os.path.isabs(root):
+            return None
+        if root in _SHELL_BUILTINS or shutil.which(root) is None:
+            return None
+        return tokens
 
     def is_command_allowed(self, command: str) -> bool:
         # Simplified version of the JS logic.
         # TODO: Implement the full whitelist/blacklist logic.
-        if "`" in command or "$(" in command:
-            return False
-        return True
+        return _DISALLOWED.search(command) is None
 
     def validate_tool_params(self, params: ShellToolParams) -> str | None:
-        if not self.is_command_allowed(params.command):
-            return f"Command is not allowed: {params.command}"
-        if not params.command.strip():
-            return "Command cannot be empty."
-        if not self.get_command_root(params.command):
-            return "Could not identify command root."
+        error = _check_command(params.command)
+        if error:
+            return error
+        # The filesystem can change between calls, so this is never cached.
         if params.directory:
-            if not is_within_root(
-                Path(self.config.get_target_dir()) / Path(params.directory),
-                Path(self.config.get_target_dir()),
-            ):
+            if not is_within_root(self._root / params.directory, self._root):
                 return "Directory must be within the project root."
         return None
 
@@ -96,44 +175,98 @@ class ShellTool(BaseTool[ShellToolParams, ToolResult]):
                 return_display=f"Error: {validation_error}",
             )
 
-        cwd = self.config.get_target_dir()
-        if params.directory:
-            cwd = cwd / params.directory
-
-        proc = await asyncio.create_subprocess_shell(
-            params.command,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=cwd,
-            preexec_fn=os.setsid,  # To kill the whole process group
+        cwd = (
+            (self._root / params.directory).resolve()
+            if params.directory
+            else self._root
         )
 
-        output = ""
+        argv = self._get_exec_args(params.command)
+        if argv is not None:
+            # Plain commands are exec'd directly, skipping the /bin/sh layer.
+            proc = await asyncio.create_subprocess_exec(
+                *argv,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=cwd,
+                preexec_fn=os.setsid,  # To kill the whole process group
+            )
+        else:
+            proc = await asyncio.create_subprocess_shell(
+                params.command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=cwd,
+                preexec_fn=os.setsid,  # To kill the whole process group
+            )
+
+        # Rolling tail of output chunks, bounded to roughly MAX_OUTPUT_BYTES.
+        output_tail: deque[bytes] = deque()
+        tail_size = 0
+        dropped_bytes = 0
+        stream_output = self.can_update_output and update_output is not None
 
         async def read_stream(stream, is_stdout):
-            nonlocal output
+            nonlocal tail_size, dropped_bytes
+            # One decoder per pipe keeps multi-byte characters that straddle
+            # chunk boundaries intact in the streamed output.
+            decoder = (
+                codecs.getincrementaldecoder("utf-8")(errors="replace")
+                if stream_output
+                else None
+            )
             while True:
-                line = await stream.readline()
-                if not line:
+                chunk = await stream.read(READ_CHUNK_SIZE)
+                if not chunk:
                     break
-                line_str = line.decode("utf-8", errors="replace")
-                output += line_str
-                if update_output:
-                    update_output(line_str)
+                output_tail.append(chunk)
+                tail_size += len(chunk)
+                while tail_size - len(output_tail[0]) >= MAX_OUTPUT_BYTES:
+                    removed = output_tail.popleft()
+                    tail_size -= len(removed)
+                    dropped_bytes += len(removed)
+                if decoder is not None:
+                    text = decoder.decode(chunk)
+                    if text:
+                        update_output(text)
+            if decoder is not None:
+                text = decoder.decode(b"", final=True)
+                if text:
+                    update_output(text)
 
         stdout_task = asyncio.create_task(read_stream(proc.stdout, True))
         stderr_task = asyncio.create_task(read_stream(proc.stderr, False))
+        wait_task = asyncio.create_task(proc.wait())
 
-        try:
-            await asyncio.wait_for(proc.wait(), timeout=300)  # 5 min timeout
-        except TimeoutError:
-            os.killpg(os.getpgid(proc.pid), signal.SIGKILL)
+        # Readers and the exit wait share one deadline.
+        _, pending = await asyncio.wait(
+            {stdout_task, stderr_task, wait_task},
+            timeout=COMMAND_TIMEOUT_SECONDS,
+        )
+        if pending:
+            try:
+                os.killpg(os.getpgid(proc.pid), SIGKILL)
+            except ProcessLookupError:
+                pass
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
             return ToolResult(
                 llm_content="Error: Command timed out.",
                 return_display="Error: Command timed out.",
             )
 
-        await asyncio.gather(stdout_task, stderr_task)
+        # Surface any reader failure.
+        stdout_task.result()
+        stderr_task.result()
+        output_bytes = b"".join(output_tail)
+        excess = len(output_bytes) - MAX_OUTPUT_BYTES
+        if excess > 0:
+            output_bytes = output_bytes[excess:]
+            dropped_bytes += excess
+        output = output_bytes.decode("utf-8", errors="replace")
+        if dropped_bytes:
+            output = f"[... {dropped_bytes} bytes truncated ...]\n{output}"
 
         return ToolResult(
             llm_content=f"Command executed with exit code {proc.returncode}\nOutput:\n{output}",
@@ -1,17 +1,34 @@
+import asyncio
 import re
 from typing import Any
 
 import html2text
 from pydantic import BaseModel, Field
 
+# selectolax's C parser extracts text much faster than html2text, but stays
+# optional.
+try:
+    from selectolax.parser import HTMLParser
+
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
 from gemini_cli_core.core.config import Config
-from gemini_cli_core.tools import BaseTool, ToolResult
+from gemini_cli_core.tools import BaseTool, ToolResult, params_schema
 from gemini_cli_core.utils.fetch import (
-    FetchError,
-    fetch_with_timeout,
+    fetch_text_with_timeout,
     is_private_ip,
 )
 
+_URL_RE = re.compile(r"https?://[^\s]+")
+_GITHUB_BLOB_RE = re.compile(r"^https?://github\.com/([^/]+/[^/]+)/blob/(.+)$")
+# Pages are cut off after this many bytes; the text handed to the model is
+# capped at MAX_CONTENT_LENGTH characters anyway.
+MAX_DOWNLOAD_BYTES = 512 * 1024
+MAX_CONTENT_LENGTH = 100000
+MAX_CONCURRENT_FETCHES = 8
+
 
 class WebFetchToolParams(BaseModel):
     prompt: str = Field(
@@ -22,7 +39,33 @@ class WebFetchToolParams(BaseModel):
 
 def extract_urls(text: str) -> list[str]:
     """Extracts URLs from a string."""
-    return re.findall(r"(https?://[^\s]+)", text)
+    return _URL_RE.findall(text)
+
+
+def _to_raw_github_url(url: str) -> str:
+    """Rewrites a GitHub blob URL to its raw content URL."""
+    return _GITHUB_BLOB_RE.sub(
+        r"https://raw.githubusercontent.com/\1/\2", url, count=1
+    )
+
+
+def _html_to_text(html: str) -> str:
+    """Converts an HTML page to plain text, capped at MAX_CONTENT_LENGTH."""
+    if SELECTOLAX_AVAILABLE:
+        tree = HTMLParser(html)
+        # html2text drops these; without stripping them selectolax would
+        # return inline scripts and styles as page text.
+        tree.strip_tags(["script", "style", "noscript", "template"])
+        node = tree.body or tree.root
+        # One line per text node keeps block structure roughly in line
+        # with html2text's output.
+        text = node.text(separator="\n", strip=True) if node else ""
+        return text[:MAX_CONTENT_LENGTH]
+
+    h = html2text.HTML2Text()
+    h.ignore_links = True
+    h.ignore_images = True
+    return h.handle(html)[:MAX_CONTENT_LENGTH]
 
 
 class WebFetchTool(BaseTool[WebFetchToolParams, ToolResult]):
@@ -35,7 +78,7 @@ class WebFetchTool(BaseTool[WebFetchToolParams, ToolResult]):
             name=self.NAME,
             display_name="WebFetch",
             description="Processes content from URL(s) embedded in a prompt.",
-            parameter_schema=WebFetchToolParams.model_json_schema(),
+            parameter_schema=params_schema(WebFetchToolParams),
         )
         self.config = config
         self.client = config.get_gemini_client()
@@ -50,38 +93,75 @@ class WebFetchTool(BaseTool[WebFetchToolParams, ToolResult]):
                 return_display="Error: No URL found.",
             )
 
-        url = urls[0]
-        if "github.com" in url and "/blob/" in url:
-            url = url.replace(
-                "github.com", "raw.githubusercontent.com"
-            ).replace("/blob/", "/")
-
-        try:
-            response = await fetch_with_timeout(url, timeout=10.0)
+        urls = [_to_raw_github_url(url) for url in urls]
 
-            h = html2text.HTML2Text()
-            h.ignore_links = True
-            h.ignore_images = True
-            text_content = h.handle(response.text)[:100000]
+        # Fetch the URLs concurrently, at most MAX_CONCURRENT_FETCHES at a
+        # time; the pooled client lets requests to the same host share
+        # connections.
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
 
-            fallback_prompt = f"The user requested: '{params.prompt}'. I fetched the content. Please answer based on this:\n\n{text_content}"
+        async def fetch(url: str) -> str:
+            async with semaphore:
+                return await self._fetch_one(url)
 
-            result = await self.client.generate_content(
-                contents=[
-                    {"role": "user", "parts": [{"text": fallback_prompt}]}
-                ],
-                generation_config={},
-                abort_signal=signal,
-            )
-            return ToolResult(
-                llm_content=self.client._get_response_text(result),
-                return_display=f"Content for {url} processed via fallback.",
-            )
-        except FetchError as e:
+        fetched_pages = await asyncio.gather(
+            *(fetch(url) for url in urls), return_exceptions=True
+        )
+        sections: list[str] = []
+        errors: list[Exception] = []
+        failures: list[str] = []
+        for url, page in zip(urls, fetched_pages, strict=True):
+            if isinstance(page, Exception):
+                # A failing URL (HTTP error status, bad content, ...) must not
+                # discard the ones that succeeded, but the model is told
+                # about it rather than left to assume it was read.
+                errors.append(page)
+                failures.append(f"--- could not fetch {url}: {page} ---")
+            elif isinstance(page, BaseException):
+                raise page
+            elif len(urls) == 1:
+                sections.append(page)
+            else:
+                sections.append(f"--- {url} ---\n\n{page}")
+
+        if not sections:
             return ToolResult(
-                llm_content=f"Error: {e}", return_display=f"Error: {e}"
+                llm_content=f"Error: {errors[0]}",
+                return_display=f"Error: {errors[0]}",
             )
 
+        text_content = "\n\n".join(sections + failures)
+        fallback_prompt = f"The user requested: '{params.prompt}'. I fetched the content. Please answer based on this:\n\n{text_content}"
+
+        result = await self.client.generate_content(
+            contents=[{"role": "user", "parts": [{"text": fallback_prompt}]}],
+            generation_config={},
+            abort_signal=signal,
+        )
+        fetched = (
+            urls[0]
+            if len(urls) == 1
+            else f"{len(sections)} of {len(urls)} URLs"
+        )
+        return ToolResult(
+            llm_content=self.client._get_response_text(result),
+            return_display=f"Content for {fetched} processed via fallback.",
+        )
+
+    async def _fetch_one(self, url: str) -> str:
+        """Fetches a single URL and returns its text content."""
+        html = await fetch_text_with_timeout(
+            url,
+            timeout=10.0,
+            max_bytes=MAX_DOWNLOAD_BYTES,
+        )
+        # HTML parsing is CPU-bound; run it on the shared CPU pool so it
+        # cannot starve concurrent fetches on the event loop.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.config.get_cpu_executor(), _html_to_text, html
+        )
+
     async def execute(
         self, params: WebFetchToolParams, signal: Any | None = None
     ) -> ToolResult:
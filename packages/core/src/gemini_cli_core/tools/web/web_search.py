@@ -1,9 +1,10 @@
+import asyncio
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from gemini_cli_core.core.config import Config
-from gemini_cli_core.tools import BaseTool, ToolResult
+from gemini_cli_core.tools import BaseTool, ToolResult, params_schema
 
 
 class WebSearchToolParams(BaseModel):
@@ -29,6 +30,55 @@ class GroundingSupportItem(BaseModel):
     groundingChunkIndices: list[int] | None = None
 
 
+_SOURCES_ADAPTER = TypeAdapter(list[GroundingChunkItem])
+_SUPPORTS_ADAPTER = TypeAdapter(list[GroundingSupportItem])
+
+
+def _apply_grounding(
+    response_text: str, grounding_metadata: dict[str, Any]
+) -> str:
+    """Inserts citation markers and appends the source list."""
+    sources_raw = grounding_metadata.get("grounding_chunks", [])
+    supports_raw = grounding_metadata.get("grounding_supports", [])
+
+    # Validate each list in a single pass through pydantic-core.
+    sources = _SOURCES_ADAPTER.validate_python(sources_raw)
+    supports = _SUPPORTS_ADAPTER.validate_python(supports_raw)
+
+    source_list_formatted: list[str] = []
+    if sources:
+        for i, source in enumerate(sources):
+            title = source.web.title or "Untitled"
+            uri = source.web.uri or "Unknown URI"
+            source_list_formatted.append(f"[{i + 1}] {title} ({uri})")
+
+    # Splice the markers and the source list into one fragment list so the
+    # final text is built with a single join.
+    parts: list[str] = []
+    cursor = 0
+    if supports:
+        insertions: list[tuple[int, str]] = []
+        for support in supports:
+            if support.segment and support.groundingChunkIndices:
+                marker = "".join(
+                    f"[{i + 1}]" for i in support.groundingChunkIndices
+                )
+                insertions.append((support.segment.endIndex, marker))
+
+        insertions.sort(key=lambda x: x[0])
+        for index, marker in insertions:
+            parts.append(response_text[cursor:index])
+            parts.append(marker)
+            cursor = max(cursor, index)
+    parts.append(response_text[cursor:])
+
+    if source_list_formatted:
+        parts.append("\n\nSources:\n")
+        parts.append("\n".join(source_list_formatted))
+
+    return "".join(parts)
+
+
 class WebSearchTool(BaseTool[WebSearchToolParams, ToolResult]):
     """A tool for performing web searches via Google Search."""
 
@@ -39,7 +89,7 @@ class WebSearchTool(BaseTool[WebSearchToolParams, ToolResult]):
             name=self.NAME,
             display_name="GoogleSearch",
             description="Performs a web search using Google Search.",
-            parameter_schema=WebSearchToolParams.model_json_schema(),
+            parameter_schema=params_schema(WebSearchToolParams),
         )
         self.config = config
         self.client = config.get_gemini_client()
@@ -61,54 +111,18 @@ class WebSearchTool(BaseTool[WebSearchToolParams, ToolResult]):
                     return_display="No results found.",
                 )
 
-            # Process grounding metadata
             grounding_metadata = result.get("candidates", [{}])[0].get(
                 "grounding_metadata", {}
             )
-            sources_raw = grounding_metadata.get("grounding_chunks", [])
-            supports_raw = grounding_metadata.get("grounding_supports", [])
-
-            sources = [
-                GroundingChunkItem.model_validate(s) for s in sources_raw
-            ]
-            supports = [
-                GroundingSupportItem.model_validate(s) for s in supports_raw
-            ]
-
-            source_list_formatted: list[str] = []
-            if sources:
-                for i, source in enumerate(sources):
-                    title = source.web.title or "Untitled"
-                    uri = source.web.uri or "Unknown URI"
-                    source_list_formatted.append(f"[{i + 1}] {title} ({uri})")
-
-            if supports:
-                insertions = []
-                for support in supports:
-                    if support.segment and support.grounding_chunk_indices:
-                        marker = "".join(
-                            f"[{i + 1}]"
-                            for i in support.grounding_chunk_indices
-                        )
-                        insertions.append(
-                            {
-                                "index": support.segment.endIndex,
-                                "marker": marker,
-                            }
-                        )
-
-                insertions.sort(key=lambda x: x["index"], reverse=True)
-                response_chars = list(response_text)
-                for insertion in insertions:
-                    response_chars.insert(
-                        insertion["index"], insertion["marker"]
-                    )
-                response_text = "".join(response_chars)
-
-            if source_list_formatted:
-                response_text += "\n\nSources:\n" + "\n".join(
-                    source_list_formatted
-                )
+            # Validation and marker insertion are CPU-bound for large
+            # grounding payloads; keep them off the event loop.
+            loop = asyncio.get_running_loop()
+            response_text = await loop.run_in_executor(
+                self.config.get_cpu_executor(),
+                _apply_grounding,
+                response_text,
+                grounding_metadata,
+            )
 
             return ToolResult(
                 llm_content=response_text,
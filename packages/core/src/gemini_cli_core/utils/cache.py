@@ -1,3 +1,57 @@
-from functools import lru_cache
+import threading
+import time
+from collections.abc import Callable
+from functools import lru_cache, update_wrapper
+from typing import Any, Generic, TypeVar
 
-__all__ = ["lru_cache"]
+__all__ = ["lru_cache", "ttl_cache"]
+
+T = TypeVar("T")
+
+
+class _TTLCacheWrapper(Generic[T]):
+    """The callable returned by ttl_cache; see there."""
+
+    def __init__(self, fn: Callable[..., T], maxsize: int, ttl_seconds: float):
+        self._fn = fn
+        self._maxsize = maxsize
+        self._ttl_seconds = ttl_seconds
+        # Insertion-ordered dict used as an LRU: hits are moved to the end,
+        # the oldest entry is evicted first.
+        self._entries: dict[Any, tuple[T, float]] = {}
+        self._lock = threading.Lock()
+        update_wrapper(self, fn)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> T:
+        key = (args, tuple(kwargs.items())) if kwargs else args
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None and now < entry[1]:
+                self._entries[key] = entry
+                return entry[0]
+        value = self._fn(*args, **kwargs)
+        with self._lock:
+            self._entries[key] = (value, now + self._ttl_seconds)
+            while len(self._entries) > self._maxsize:
+                del self._entries[next(iter(self._entries))]
+        return value
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def ttl_cache(
+    maxsize: int = 1024, ttl_seconds: float = 5
+) -> Callable[[Callable[..., T]], _TTLCacheWrapper[T]]:
+    """
+    Like lru_cache, but entries expire `ttl_seconds` after they were
+    computed, so results backed by the filesystem are eventually refreshed.
+    Arguments must be hashable. The wrapper exposes cache_clear().
+    """
+
+    def decorator(fn: Callable[..., T]) -> _TTLCacheWrapper[T]:
+        return _TTLCacheWrapper(fn, maxsize, ttl_seconds)
+
+    return decorator
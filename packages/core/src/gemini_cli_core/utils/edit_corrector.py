@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import re
-from collections import OrderedDict
 from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel
@@ -16,20 +17,44 @@ logger = logging.getLogger(__name__)
 
 # --- Caches ---
 MAX_CACHE_SIZE = 50
-edit_correction_cache: OrderedDict[str, CorrectedEditResult] = OrderedDict()
-file_content_correction_cache: OrderedDict[str, str] = OrderedDict()
+# Keys use a digest of the file content rather than the content itself, so a
+# lookup hashes 16 bytes instead of copying and hashing the whole file.
+_EditCacheKey = tuple[bytes, str, str]
+# Plain dicts keep insertion order; LRU order is kept by re-inserting on hit.
+edit_correction_cache: dict[_EditCacheKey, CorrectedEditResult] = {}
+file_content_correction_cache: dict[bytes, str] = {}
+_MISSING = object()
+
+# The same content object is usually passed for several edits in a row, so
+# its digest is memoized by identity. str objects can't be weakly referenced,
+# so only the most recent one is kept alive for this.
+_last_digest: tuple[str, bytes] | None = None
+
+
+def _content_digest(content: str) -> bytes:
+    global _last_digest
+    if _last_digest is not None and _last_digest[0] is content:
+        return _last_digest[1]
+    digest = hashlib.blake2b(
+        content.encode("utf-8", "surrogatepass"), digest_size=16
+    ).digest()
+    _last_digest = (content, digest)
+    return digest
+
+
+def _get_from_cache(cache: dict, key: Any) -> Any:
+    value = cache.pop(key, _MISSING)
+    if value is _MISSING:
+        return None
+    cache[key] = value
+    return value
 
 
-def _get_from_cache(cache: OrderedDict, key: str) -> Any:
+def _set_in_cache(cache: dict, key: Any, value: Any):
     if key in cache:
-        cache.move_to_end(key)
-        return cache[key]
-    return None
-
-
-def _set_in_cache(cache: OrderedDict, key: str, value: Any):
-    if len(cache) >= MAX_CACHE_SIZE:
-        cache.popitem(last=False)
+        del cache[key]
+    elif len(cache) >= MAX_CACHE_SIZE:
+        del cache[next(iter(cache))]
     cache[key] = value
 
 
@@ -91,6 +116,123 @@ CORRECT_STRING_ESCAPING_SCHEMA = {
 }
 
 
+# --- Prompts ---
+# Static prompt text is kept in module constants; each call joins it with the
+# inputs in a single allocation.
+_OLD_MISMATCH_PREFIX = """Background: A process needs to find an exact, literal, unique match for a snippet of text inside a file's content. The provided snippet failed to match perfectly. This is most likely because it was improperly escaped.
+
+Task: Analyze the provided file content and the problematic target snippet. Identify the part of the file content that the snippet was *most likely* intended to match. Output the *exact, literal* text of that portion from the file content. *Only* focus on removing extraneous escape characters, fixing formatting, whitespace, or minor variations to achieve a perfect literal match. The output must be the exact literal text as it appears in the file.
+
+Problematic Target Snippet:
+```
+"""
+
+_OLD_MISMATCH_MID = """
+```
+
+File Content:
+```
+"""
+
+_OLD_MISMATCH_SUFFIX = """
+```
+
+For example, if the problematic snippet is "\\nconst greeting = `Hello \\`\\${name}\\\\``;" and the file content has "\nconst greeting = `Hello `\\${name}``;", then corrected_target_snippet should be exactly that to fix the incorrect escaping.
+If the difference is only whitespace or formatting, apply similar changes to corrected_target_snippet.
+
+Return a JSON with only one key 'corrected_target_snippet' with the corrected target snippet. If no clear, unique match can be found, return an empty 'corrected_target_snippet'."""
+
+_NEW_STRING_PREFIX = """Background: A text replacement operation is planned. The original text to be replaced (original_old_string) differs slightly from the actual text in the file (corrected_old_string). The original_old_string has now been corrected to match the file content.
+We now need to adjust the replacement text (original_new_string) so that it makes sense as a replacement for the corrected_old_string, while preserving the intent of the original change.
+
+original_old_string (what was originally going to be looked for):
+```
+"""
+
+_NEW_STRING_MID1 = """
+```
+
+corrected_old_string (what was actually found in the file and will be replaced):
+```
+"""
+
+_NEW_STRING_MID2 = """
+```
+
+original_new_string (what was intended to replace original_old_string):
+```
+"""
+
+_NEW_STRING_SUFFIX = """
+```
+
+Task: Based on the differences between original_old_string and corrected_old_string, and the content of original_new_string, generate a corrected_new_string. This corrected_new_string should be what original_new_string would have been if it were designed to directly replace corrected_old_string, maintaining the spirit of the original transformation.
+
+For example, if original_old_string was "\\nconst x = 1;" and corrected_old_string is "  const x = 1;", and original_new_string was "\\nconst x = 2;", then corrected_new_string should likely be "  const x = 2;" to match the indentation.
+
+Return a JSON with only one key 'corrected_new_string'. If no adjustment is deemed necessary or possible, return the original original_new_string."""
+
+_NEW_ESC_PREFIX = """Background: A text replacement is planned. The text to be replaced (old_string) has been correctly identified in a file. However, the replacement text (new_string) may have been incorrectly escaped by a previous LLM generation (e.g., using \\n for a newline instead of \n, or unnecessary quotes like \\"Hello\\" instead of "Hello").
+
+old_string (this is the exact text that will be replaced):
+```
+"""
+
+_NEW_ESC_MID = """
+```
+
+potentially_problematic_new_string (this is what should replace old_string, but might have bad escaping, or it could be perfectly fine):
+```
+"""
+
+_NEW_ESC_SUFFIX = """
+```
+
+Task: Analyze the potentially_problematic_new_string. If it is syntactically invalid due to incorrect escaping (e.g., "\\n", "\\t", "\\\\", "\\'", "\\""), fix the invalid syntax. The goal is to make sure the new_string is valid and will be interpreted correctly when inserted into code.
+
+For example, if old_string is "foo" and potentially_problematic_new_string is "bar\\nbaz", then corrected_new_string_escaping should be "bar\nbaz".
+If potentially_problematic_new_string is console.log(\\"Hello World\\"), it should be console.log("Hello World").
+
+Return a JSON with only one key 'corrected_new_string_escaping' with the corrected string. If no escaping correction is needed, return the original potentially_problematic_new_string."""
+
+_STRING_ESC_PREFIX = """Background: An LLM just generated the potentially_problematic_string, which may have been improperly escaped (e.g., using \\n for a newline instead of \n, or unnecessary quotes like \\"Hello\\" instead of "Hello").
+
+potentially_problematic_string (This text might have bad escaping, or it could be perfectly fine):
+```
+"""
+
+_STRING_ESC_SUFFIX = """
+```
+
+Task: Analyze the potentially_problematic_string. If it is syntactically invalid due to incorrect escaping (e.g., "\\n", "\\t", "\\\\", "\\'", "\\""), fix the invalid syntax. The goal is to make sure the text is valid and will be interpreted correctly.
+
+For example, if potentially_problematic_string is "bar\\nbaz", then corrected_string_escaping should be "bar\nbaz".
+If potentially_problematic_string is console.log(\\"Hello World\\"), it should be console.log("Hello World").
+
+Return a JSON with only one key 'corrected_string_escaping' with the corrected string. If no escaping correction is needed, return the original potentially_problematic_string."""
+
+
+# Edits applied in the same turn correct concurrently; cap how many corrector
+# requests are in flight at once.
+MAX_CONCURRENT_CORRECTIONS = 8
+_correction_slots = asyncio.Semaphore(MAX_CONCURRENT_CORRECTIONS)
+
+
+async def _generate_correction(
+    client: GeminiClient,
+    prompt: str,
+    schema: dict[str, Any],
+    abort_signal: Any,
+) -> dict[str, Any]:
+    """Sends one corrector prompt, bounded by the shared concurrency cap."""
+    async with _correction_slots:
+        return await client.generate_json(
+            contents=[{"role": "user", "parts": [{"text": prompt}]}],
+            schema=schema,
+            abort_signal=abort_signal,
+        )
+
+
 async def ensure_correct_edit(
     current_content: str,
     original_params: EditToolParams,
@@ -101,21 +243,27 @@ async def ensure_correct_edit(
     Ensures edit parameters are correct, attempting to fix them if necessary.
     This is a detailed port of the original TypeScript logic.
     """
-    cache_key = f"{current_content}---{original_params.old_string}---{original_params.new_string}"
+    cache_key = (
+        _content_digest(current_content),
+        original_params.old_string,
+        original_params.new_string,
+    )
     cached_result = _get_from_cache(edit_correction_cache, cache_key)
     if cached_result:
         return cached_result
 
     final_new_string = original_params.new_string
-    new_string_potentially_escaped = (
-        unescape_string_for_gemini_bug(original_params.new_string)
-        != original_params.new_string
-    )
+    unescaped_new_string = unescape_string_for_gemini_bug(final_new_string)
+    new_string_potentially_escaped = unescaped_new_string != final_new_string
 
     expected_replacements = original_params.expected_replacements or 1
 
     final_old_string = original_params.old_string
+    unescaped_old_string = unescape_string_for_gemini_bug(final_old_string)
     occurrences = count_occurrences(current_content, final_old_string)
+    # Occurrences of final_old_string, kept in step with it so the result
+    # doesn't need another scan of current_content.
+    final_occurrences = occurrences
 
     if occurrences == expected_replacements:
         if new_string_potentially_escaped:
@@ -128,15 +276,17 @@ async def ensure_correct_edit(
     elif occurrences > expected_replacements:
         pass  # Too many matches, fall through. Validation will fail.
     else:  # occurrences is 0 or less than expected
-        unescaped_old_string = unescape_string_for_gemini_bug(
-            original_params.old_string
-        )
-        unescaped_occurrences = count_occurrences(
-            current_content, unescaped_old_string
-        )
+        if unescaped_old_string == original_params.old_string:
+            # Nothing to unescape; the count can't differ.
+            unescaped_occurrences = occurrences
+        else:
+            unescaped_occurrences = count_occurrences(
+                current_content, unescaped_old_string
+            )
 
         if unescaped_occurrences == expected_replacements:
             final_old_string = unescaped_old_string
+            final_occurrences = unescaped_occurrences
             if new_string_potentially_escaped:
                 final_new_string = await correct_new_string(
                     client,
@@ -146,34 +296,39 @@ async def ensure_correct_edit(
                     abort_signal,
                 )
         elif unescaped_occurrences == 0:
+            # The new_string adjustment below is conditioned on the snippet
+            # this call returns, so the two LLM calls cannot overlap.
             llm_corrected_old_string = await correct_old_string_mismatch(
                 client, current_content, unescaped_old_string, abort_signal
             )
+            # An empty snippet means the LLM found no match.
             llm_occurrences = count_occurrences(
                 current_content, llm_corrected_old_string
             )
 
             if llm_occurrences == expected_replacements:
                 final_old_string = llm_corrected_old_string
+                final_occurrences = llm_occurrences
                 if new_string_potentially_escaped:
-                    base_new_string_for_llm = unescape_string_for_gemini_bug(
-                        original_params.new_string
-                    )
                     final_new_string = await correct_new_string(
                         client,
                         original_params.old_string,
                         final_old_string,
-                        base_new_string_for_llm,
+                        unescaped_new_string,
                         abort_signal,
                     )
             else:  # LLM failed
                 final_old_string = original_params.old_string
-    final_old_string, final_new_string = trim_pair_if_possible(
-        final_old_string,
-        final_new_string,
-        current_content,
-        expected_replacements,
+    final_old_string, final_new_string, trimmed_occurrences = (
+        trim_pair_if_possible(
+            final_old_string,
+            final_new_string,
+            current_content,
+            expected_replacements,
+        )
     )
+    if trimmed_occurrences is not None:
+        final_occurrences = trimmed_occurrences
 
     result = CorrectedEditResult(
         params=CorrectedEditParams(
@@ -181,7 +336,7 @@ async def ensure_correct_edit(
             old_string=final_old_string,
             new_string=final_new_string,
         ),
-        occurrences=count_occurrences(current_content, final_old_string),
+        occurrences=final_occurrences,
     )
     _set_in_cache(edit_correction_cache, cache_key, result)
     return result
@@ -191,18 +346,23 @@ async def ensure_correct_file_content(
     content: str, client: GeminiClient, abort_signal: Any | None = None
 ) -> str:
     """Ensures a new file's content is correctly unescaped, using an LLM if needed."""
-    cached_result = _get_from_cache(file_content_correction_cache, content)
+    cache_key = _content_digest(content)
+    cached_result = _get_from_cache(file_content_correction_cache, cache_key)
     if cached_result is not None:
         return cached_result
 
-    if unescape_string_for_gemini_bug(content) == content:
-        _set_in_cache(file_content_correction_cache, content, content)
+    unescaped = unescape_string_for_gemini_bug(content)
+    if unescaped == content:
+        _set_in_cache(file_content_correction_cache, cache_key, content)
         return content
 
+    # The heuristic alone can't tell an over-escaped string from a legitimate
+    # escape inside a string literal (e.g. "\\n" in source), so the LLM
+    # decides.
     corrected_content = await correct_string_escaping(
         content, client, abort_signal
     )
-    _set_in_cache(file_content_correction_cache, content, corrected_content)
+    _set_in_cache(file_content_correction_cache, cache_key, corrected_content)
     return corrected_content
 
 
@@ -213,31 +373,18 @@ async def correct_old_string_mismatch(
     abort_signal: Any,
 ) -> str:
     """Uses an LLM to correct a mismatched old_string."""
-    prompt = f"""
-Background: A process needs to find an exact, literal, unique match for a snippet of text inside a file's content. The provided snippet failed to match perfectly. This is most likely because it was improperly escaped.
-
-Task: Analyze the provided file content and the problematic target snippet. Identify the part of the file content that the snippet was *most likely* intended to match. Output the *exact, literal* text of that portion from the file content. *Only* focus on removing extraneous escape characters, fixing formatting, whitespace, or minor variations to achieve a perfect literal match. The output must be the exact literal text as it appears in the file.
-
-Problematic Target Snippet:
-```
-{problematic_snippet}
-```
-
-File Content:
-```
-{file_content}
-```
-
-For example, if the problematic snippet is "\\nconst greeting = `Hello \\`\\${{name}}\\\\``;" and the file content has "\nconst greeting = `Hello `\\${{name}}``;", then corrected_target_snippet should be exactly that to fix the incorrect escaping.
-If the difference is only whitespace or formatting, apply similar changes to corrected_target_snippet.
-
-Return a JSON with only one key 'corrected_target_snippet' with the corrected target snippet. If no clear, unique match can be found, return an empty 'corrected_target_snippet'.
-    """.strip()
+    prompt = "".join(
+        (
+            _OLD_MISMATCH_PREFIX,
+            problematic_snippet,
+            _OLD_MISMATCH_MID,
+            file_content,
+            _OLD_MISMATCH_SUFFIX,
+        )
+    )
     try:
-        response = await client.generate_json(
-            contents=[{"role": "user", "parts": [{"text": prompt}]}],
-            schema=OLD_STRING_CORRECTION_SCHEMA,
-            abort_signal=abort_signal,
+        response = await _generate_correction(
+            client, prompt, OLD_STRING_CORRECTION_SCHEMA, abort_signal
         )
         return response.get("corrected_target_snippet", problematic_snippet)
     except Exception as e:
@@ -258,36 +405,20 @@ async def correct_new_string(
     """Adjusts the new_string to align with the corrected old_string."""
     if original_old == corrected_old:
         return original_new
-    prompt = f"""
-Background: A text replacement operation is planned. The original text to be replaced (original_old_string) differs slightly from the actual text in the file (corrected_old_string). The original_old_string has now been corrected to match the file content.
-We now need to adjust the replacement text (original_new_string) so that it makes sense as a replacement for the corrected_old_string, while preserving the intent of the original change.
-
-original_old_string (what was originally going to be looked for):
-```
-{original_old}
-```
-
-corrected_old_string (what was actually found in the file and will be replaced):
-```
-{corrected_old}
-```
-
-original_new_string (what was intended to replace original_old_string):
-```
-{original_new}
-```
-
-Task: Based on the differences between original_old_string and corrected_old_string, and the content of original_new_string, generate a corrected_new_string. This corrected_new_string should be what original_new_string would have been if it were designed to directly replace corrected_old_string, maintaining the spirit of the original transformation.
-
-For example, if original_old_string was "\\nconst x = 1;" and corrected_old_string is "  const x = 1;", and original_new_string was "\\nconst x = 2;", then corrected_new_string should likely be "  const x = 2;" to match the indentation.
-
-Return a JSON with only one key 'corrected_new_string'. If no adjustment is deemed necessary or possible, return the original original_new_string.
-    """.strip()
+    prompt = "".join(
+        (
+            _NEW_STRING_PREFIX,
+            original_old,
+            _NEW_STRING_MID1,
+            corrected_old,
+            _NEW_STRING_MID2,
+            original_new,
+            _NEW_STRING_SUFFIX,
+        )
+    )
     try:
-        response = await client.generate_json(
-            contents=[{"role": "user", "parts": [{"text": prompt}]}],
-            schema=NEW_STRING_CORRECTION_SCHEMA,
-            abort_signal=abort_signal,
+        response = await _generate_correction(
+            client, prompt, NEW_STRING_CORRECTION_SCHEMA, abort_signal
         )
         return response.get("corrected_new_string", original_new)
     except Exception as e:
@@ -305,31 +436,18 @@ async def correct_new_string_escaping(
     abort_signal: Any,
 ) -> str:
     """Corrects improper escaping in a new_string."""
-    prompt = f"""
-Background: A text replacement is planned. The text to be replaced (old_string) has been correctly identified in a file. However, the replacement text (new_string) may have been incorrectly escaped by a previous LLM generation (e.g., using \\n for a newline instead of \n, or unnecessary quotes like \\"Hello\\" instead of "Hello").
-
-old_string (this is the exact text that will be replaced):
-```
-{old_string}
-```
-
-potentially_problematic_new_string (this is what should replace old_string, but might have bad escaping, or it could be perfectly fine):
-```
-{problematic_new_string}
-```
-
-Task: Analyze the potentially_problematic_new_string. If it is syntactically invalid due to incorrect escaping (e.g., "\\n", "\\t", "\\\\", "\\'", "\\""), fix the invalid syntax. The goal is to make sure the new_string is valid and will be interpreted correctly when inserted into code.
-
-For example, if old_string is "foo" and potentially_problematic_new_string is "bar\\nbaz", then corrected_new_string_escaping should be "bar\nbaz".
-If potentially_problematic_new_string is console.log(\\"Hello World\\"), it should be console.log("Hello World").
-
-Return a JSON with only one key 'corrected_new_string_escaping' with the corrected string. If no escaping correction is needed, return the original potentially_problematic_new_string.
-    """.strip()
+    prompt = "".join(
+        (
+            _NEW_ESC_PREFIX,
+            old_string,
+            _NEW_ESC_MID,
+            problematic_new_string,
+            _NEW_ESC_SUFFIX,
+        )
+    )
     try:
-        response = await client.generate_json(
-            contents=[{"role": "user", "parts": [{"text": prompt}]}],
-            schema=CORRECT_NEW_STRING_ESCAPING_SCHEMA,
-            abort_signal=abort_signal,
+        response = await _generate_correction(
+            client, prompt, CORRECT_NEW_STRING_ESCAPING_SCHEMA, abort_signal
         )
         return response.get(
             "corrected_new_string_escaping", problematic_new_string
@@ -347,26 +465,16 @@ async def correct_string_escaping(
     problematic_string: str, client: GeminiClient, abort_signal: Any
 ) -> str:
     """Corrects a generic string that might be improperly escaped."""
-    prompt = f"""
-Background: An LLM just generated the potentially_problematic_string, which may have been improperly escaped (e.g., using \\n for a newline instead of \n, or unnecessary quotes like \\"Hello\\" instead of "Hello").
-
-potentially_problematic_string (This text might have bad escaping, or it could be perfectly fine):
-```
-{problematic_string}
-```
-
-Task: Analyze the potentially_problematic_string. If it is syntactically invalid due to incorrect escaping (e.g., "\\n", "\\t", "\\\\", "\\'", "\\""), fix the invalid syntax. The goal is to make sure the text is valid and will be interpreted correctly.
-
-For example, if potentially_problematic_string is "bar\\nbaz", then corrected_string_escaping should be "bar\nbaz".
-If potentially_problematic_string is console.log(\\"Hello World\\"), it should be console.log("Hello World").
-
-Return a JSON with only one key 'corrected_string_escaping' with the corrected string. If no escaping correction is needed, return the original potentially_problematic_string.
-    """.strip()
+    prompt = "".join(
+        (
+            _STRING_ESC_PREFIX,
+            problematic_string,
+            _STRING_ESC_SUFFIX,
+        )
+    )
     try:
-        response = await client.generate_json(
-            contents=[{"role": "user", "parts": [{"text": prompt}]}],
-            schema=CORRECT_STRING_ESCAPING_SCHEMA,
-            abort_signal=abort_signal,
+        response = await _generate_correction(
+            client, prompt, CORRECT_STRING_ESCAPING_SCHEMA, abort_signal
         )
         return response.get("corrected_string_escaping", problematic_string)
     except Exception as e:
@@ -382,35 +490,51 @@ def trim_pair_if_possible(
     trim_if_target_trims: str,
     content: str,
     expected_replacements: int,
-) -> tuple[str, str]:
+) -> tuple[str, str, int | None]:
     """
     Trims whitespace from both ends of a pair of strings if the trimmed target still
     has the expected number of occurrences in the content.
+
+    The third element is the occurrence count of the trimmed target, or None
+    when the pair is returned unchanged.
     """
     trimmed_target = target.strip()
     if len(target) != len(trimmed_target):
         trimmed_occurrences = count_occurrences(content, trimmed_target)
         if trimmed_occurrences == expected_replacements:
-            return trimmed_target, trim_if_target_trims.strip()
-    return target, trim_if_target_trims
+            return (
+                trimmed_target,
+                trim_if_target_trims.strip(),
+                trimmed_occurrences,
+            )
+    return target, trim_if_target_trims, None
 
 
-def unescape_string_for_gemini_bug(input_string: str) -> str:
-    """Fixes specific escaping errors in LLM-generated strings."""
+_UNESCAPE_RE = re.compile(r"\\+(n|t|r|'|\"|`|\\|\n)")
+
+# Every character the pattern can capture has an entry.
+_UNESCAPE_MAP = {
+    "n": "\n",
+    "t": "\t",
+    "r": "\r",
+    "'": "'",
+    '"': '"',
+    "`": "`",
+    "\\": "\\",
+    "\n": "\n",
+}
+
+
+def _unescape_match(match: re.Match) -> str:
+    return _UNESCAPE_MAP[match.group(1)]
 
-    def replacer(match: re.Match) -> str:
-        char = match.group(1)
-        if char == "n":
-            return "\n"
-        if char == "t":
-            return "\t"
-        if char == "r":
-            return "\r"
-        if char in ("'", '"', "`", "\\", "\n"):
-            return char
-        return match.group(0)
 
-    return re.sub(r"\\+(n|t|r|'|\"|`|\\|\n)", replacer, input_string)
+def unescape_string_for_gemini_bug(input_string: str) -> str:
+    """Fixes specific escaping errors in LLM-generated strings."""
+    # Every match needs a backslash; skip the regex scan when there is none.
+    if "\\" not in input_string:
+        return input_string
+    return _UNESCAPE_RE.sub(_unescape_match, input_string)
 
 
 def count_occurrences(text: str, sub: str) -> int:
@@ -420,5 +544,7 @@ def count_occurrences(text: str, sub: str) -> int:
 
 def reset_edit_corrector_caches_test_only():
     """Resets all caches in this module, for testing purposes only."""
+    global _last_digest
     edit_correction_cache.clear()
     file_content_correction_cache.clear()
+    _last_digest = None
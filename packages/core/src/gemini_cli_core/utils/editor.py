@@ -3,7 +3,9 @@ import logging
 import os
 import shutil
 import sys
-from typing import Literal, TypedDict
+from typing import Literal, TypedDict, TypeGuard
+
+from gemini_cli_core.utils.cache import lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -12,21 +14,6 @@ EditorType = Literal[
     "vscode", "vscodium", "windsurf", "cursor", "vim", "neovim", "zed"
 ]
 
-VALID_EDITORS: set[EditorType] = {
-    "vscode",
-    "vscodium",
-    "windsurf",
-    "cursor",
-    "vim",
-    "neovim",
-    "zed",
-}
-
-
-def is_valid_editor_type(editor: str) -> "EditorType":
-    """Type guard to check if a string is a valid EditorType."""
-    return editor in VALID_EDITORS
-
 
 class DiffCommand(TypedDict):
     """Represents a command and its arguments to run a diff."""
@@ -35,6 +22,7 @@ class DiffCommand(TypedDict):
     args: list[str]
 
 
+@lru_cache(maxsize=32)
 def command_exists(cmd: str) -> bool:
     """Checks if a command exists in the system's PATH."""
     return shutil.which(cmd) is not None
@@ -51,22 +39,38 @@ EDITOR_COMMANDS: dict[EditorType, dict[str, str]] = {
     "zed": {"win32": "zed", "default": "zed"},
 }
 
+VALID_EDITORS: frozenset[str] = frozenset(EDITOR_COMMANDS)
+
 
+def is_valid_editor_type(editor: str) -> TypeGuard[EditorType]:
+    """Type guard to check if a string is a valid EditorType."""
+    return editor in VALID_EDITORS
+
+
+_GUI_EDITORS: frozenset[str] = frozenset(
+    {"vscode", "vscodium", "windsurf", "cursor", "zed"}
+)
+_TERMINAL_EDITORS: frozenset[str] = frozenset({"vim", "neovim"})
+
+# The executable for each editor on the current platform.
+_PLATFORM_KEY = "win32" if sys.platform == "win32" else "default"
+EDITOR_CMD: dict[EditorType, str] = {
+    editor: config[_PLATFORM_KEY] for editor, config in EDITOR_COMMANDS.items()
+}
+
+
+# Installed editors don't change while the process runs, so PATH is only
+# searched once per editor.
+@lru_cache(maxsize=None)
 def check_has_editor_type(editor: EditorType) -> bool:
     """Checks if the executable for a given editor type is available."""
-    command_config = EDITOR_COMMANDS[editor]
-    command = (
-        command_config["win32"]
-        if sys.platform == "win32"
-        else command_config["default"]
-    )
-    return command_exists(command)
+    return command_exists(EDITOR_CMD[editor])
 
 
 def allow_editor_type_in_sandbox(editor: EditorType) -> bool:
     """Checks if the editor is permitted to run in the current sandbox environment."""
     not_using_sandbox = not os.getenv("SANDBOX")
-    if editor in ["vscode", "vscodium", "windsurf", "cursor", "zed"]:
+    if editor in _GUI_EDITORS:
         return not_using_sandbox
     return True
 
@@ -82,50 +86,47 @@ def is_editor_available(editor: str | None) -> bool:
     return False
 
 
+# Static arguments for the diff commands; only the two paths vary per call.
+_GUI_DIFF_ARGS: tuple[str, ...] = ("--wait", "--diff")
+_VIM_DIFF_ARGS: tuple[str, ...] = (
+    "-d",
+    "-i",
+    "NONE",  # skip viminfo to avoid E138 errors
+    "-c",
+    "wincmd h | set readonly | wincmd l",  # left readonly, right editable
+    "-c",  # set up diff colors
+    "highlight DiffAdd cterm=bold ctermbg=22 guibg=#005f00 | "
+    "highlight DiffChange cterm=bold ctermbg=24 guibg=#005f87 | "
+    "highlight DiffText ctermbg=21 guibg=#0000af | "
+    "highlight DiffDelete ctermbg=52 guibg=#5f0000",
+    "-c",  # show helpful messages in tabline
+    "set showtabline=2 | set tabline=[Instructions]\\ :wqa(save\\ &\\ quit)\\ \\|\\ i/esc(toggle\\ edit\\ mode)",
+    "-c",
+    "wincmd h | setlocal statusline=OLD\\ FILE",
+    "-c",
+    "wincmd l | setlocal statusline=%#StatusBold#NEW\\ FILE\\ :wqa(save\\ &\\ quit)\\ \\|\\ i/esc(toggle\\ edit\\ mode)",
+    "-c",
+    "autocmd WinClosed * wqa",  # auto-close when one window is closed
+)
+
+
 def get_diff_command(
     old_path: str, new_path: str, editor: EditorType
 ) -> DiffCommand | None:
     """Gets the appropriate diff command and arguments for a specific editor."""
-    command_config = EDITOR_COMMANDS.get(editor)
-    if not command_config:
+    command = EDITOR_CMD.get(editor)
+    if not command:
         return None
 
-    command = (
-        command_config["win32"]
-        if sys.platform == "win32"
-        else command_config["default"]
-    )
-
-    if editor in ["vscode", "vscodium", "windsurf", "cursor", "zed"]:
+    if editor in _GUI_EDITORS:
         return {
             "command": command,
-            "args": ["--wait", "--diff", old_path, new_path],
+            "args": [*_GUI_DIFF_ARGS, old_path, new_path],
         }
-    if editor in ["vim", "neovim"]:
+    if editor in _TERMINAL_EDITORS:
         return {
             "command": command,
-            "args": [
-                "-d",
-                "-i",
-                "NONE",  # skip viminfo to avoid E138 errors
-                "-c",
-                "wincmd h | set readonly | wincmd l",  # left readonly, right editable
-                "-c",  # set up diff colors
-                "highlight DiffAdd cterm=bold ctermbg=22 guibg=#005f00 | "
-                "highlight DiffChange cterm=bold ctermbg=24 guibg=#005f87 | "
-                "highlight DiffText ctermbg=21 guibg=#0000af | "
-                "highlight DiffDelete ctermbg=52 guibg=#5f0000",
-                "-c",  # show helpful messages in tabline
-                "set showtabline=2 | set tabline=[Instructions]\\ :wqa(save\\ &\\ quit)\\ \\|\\ i/esc(toggle\\ edit\\ mode)",
-                "-c",
-                "wincmd h | setlocal statusline=OLD\\ FILE",
-                "-c",
-                "wincmd l | setlocal statusline=%#StatusBold#NEW\\ FILE\\ :wqa(save\\ &\\ quit)\\ \\|\\ i/esc(toggle\\ edit\\ mode)",
-                "-c",
-                "autocmd WinClosed * wqa",  # auto-close when one window is closed
-                old_path,
-                new_path,
-            ],
+            "args": [*_VIM_DIFF_ARGS, old_path, new_path],
         }
     return None
 
@@ -1,12 +1,15 @@
-import json
+import asyncio
 import logging
 import tempfile
-from datetime import datetime
+import time
+import traceback
 from pathlib import Path
 from typing import Any
 
 import httpx
 
+from gemini_cli_core.utils.json_utils import dumps_indented
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,7 +57,10 @@ async def report_error(
     error_type: str = "general",
 ):
     """Generates an error report and writes it to a temporary file."""
-    timestamp = datetime.now().isoformat().replace(":", "-").replace(".", "-")
+    now = time.time()
+    usec = int((now % 1) * 1_000_000)
+    timestamp = time.strftime("%Y-%m-%dT%H-%M-%S", time.localtime(now))
+    timestamp = f"{timestamp}-{usec:06d}"
     report_file_name = f"gemini-client-error-{error_type}-{timestamp}.json"
     report_path = Path(tempfile.gettempdir()) / report_file_name
 
@@ -62,9 +68,7 @@ async def report_error(
     if isinstance(error, Exception):
         error_to_report["message"] = str(error)
         error_to_report["stack"] = "".join(
-            __import__("traceback").format_exception(
-                type(error), error, error.__traceback__
-            )
+            traceback.TracebackException.from_exception(error).format()
         )
     else:
         error_to_report["message"] = get_error_message(error)
@@ -74,9 +78,9 @@ async def report_error(
         report_content["context"] = context
 
     try:
-        report_str = json.dumps(report_content, indent=2, default=str)
-        with report_path.open("w", encoding="utf-8") as f:
-            f.write(report_str)
+        report_bytes = dumps_indented(report_content, default=str).encode()
+        # Keep the file write off the event loop.
+        await asyncio.to_thread(report_path.write_bytes, report_bytes)
         logger.error(f"{base_message} Full report available at: {report_path}")
     except Exception as e:
         logger.error(f"{base_message} Failed to write error report: {e}")
@@ -1,19 +1,10 @@
-import re
-from typing import Final
-from urllib.parse import urlparse
+import codecs
+import ipaddress
+from urllib.parse import ParseResult, urlparse
 
 import httpx
 
-# Compiled regexes for private IP ranges.
-PRIVATE_IP_RANGES: Final[list[re.Pattern[str]]] = [
-    re.compile(r"^10\."),
-    re.compile(r"^127\."),
-    re.compile(r"^172\.(1[6-9]|2[0-9]|3[0-1])\."),
-    re.compile(r"^192\.168\."),
-    re.compile(r"^::1$"),
-    re.compile(r"^fc00:"),
-    re.compile(r"^fe80:"),
-]
+from gemini_cli_core.utils.cache import lru_cache
 
 
 class FetchError(Exception):
@@ -24,30 +15,82 @@ class FetchError(Exception):
         self.code = code
 
 
+@lru_cache(maxsize=256)
+def _parsed(url: str) -> ParseResult:
+    """Parses a URL; cached, since the same URLs are checked repeatedly."""
+    return urlparse(url)
+
+
+@lru_cache(maxsize=1024)
+def _is_private_host(hostname: str) -> bool:
+    """Checks whether a hostname is a non-public address; cached per host."""
+    # Handle localhost explicitly, as it is a name rather than an address.
+    if hostname == "localhost":
+        return True
+    try:
+        addr = ipaddress.ip_address(hostname)
+    except ValueError:
+        # A DNS name; it is not resolved here.
+        return False
+    return (
+        addr.is_private
+        or addr.is_loopback
+        or addr.is_link_local
+        or addr.is_reserved
+    )
+
+
 def is_private_ip(url: str) -> bool:
     """
     Checks if a URL resolves to a private or local IP address.
     """
     try:
-        hostname = urlparse(url).hostname
+        hostname = _parsed(url).hostname
         if not hostname:
             return False
-        # Handle localhost explicitly, as it may not be covered by IP ranges.
-        if hostname == "localhost":
-            return True
-        return any(r.search(hostname) for r in PRIVATE_IP_RANGES)
+        return _is_private_host(hostname)
     except Exception:
         # If URL parsing fails, treat it as not a private IP.
         return False
 
 
-async def fetch_with_timeout(url: str, timeout: float) -> httpx.Response:
+# All outbound HTTP outside the API client (web fetches, model probes) shares
+# one pooled client, so repeat requests to a host reuse its connection
+# instead of a fresh TCP/TLS setup. Servers close it on shutdown.
+_shared_client: httpx.AsyncClient | None = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Returns the process-wide pooled client, creating it if needed."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_keepalive_connections=32, max_connections=64
+            )
+        )
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Closes the process-wide pooled client."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
+async def fetch_with_timeout(
+    url: str, timeout: float, client: httpx.AsyncClient | None = None
+) -> httpx.Response:
     """
     Fetches a URL with a specified timeout, raising a custom FetchError on failure.
 
     Args:
         url: The URL to fetch.
         timeout: The timeout in seconds.
+        client: An optional long-lived client whose connection pool is reused.
+            The module's shared client is used when omitted.
 
     Returns:
         The httpx.Response object.
@@ -57,10 +100,10 @@ async def fetch_with_timeout(url: str, timeout: float) -> httpx.Response:
 
     """
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, timeout=timeout)
-            response.raise_for_status()
-            return response
+        client = client or get_shared_client()
+        response = await client.get(url, timeout=timeout)
+        response.raise_for_status()
+        return response
     except httpx.TimeoutException:
         raise FetchError(
             f"Request timed out after {timeout}s", "ETIMEDOUT"
@@ -68,3 +111,53 @@ async def fetch_with_timeout(url: str, timeout: float) -> httpx.Response:
     except httpx.RequestError as e:
         # Encapsulate generic httpx errors into our custom FetchError.
         raise FetchError(f"Request failed: {e}") from e
+
+
+async def fetch_text_with_timeout(
+    url: str,
+    timeout: float,
+    max_bytes: int,
+    client: httpx.AsyncClient | None = None,
+) -> str:
+    """
+    Streams a URL's body and stops downloading once `max_bytes` have been
+    received, returning the decoded (possibly truncated) text.
+
+    Raises:
+        FetchError: If the request times out or another request error occurs.
+
+    """
+    try:
+        client = client or get_shared_client()
+        return await _stream_text(client, url, timeout, max_bytes)
+    except httpx.TimeoutException:
+        raise FetchError(
+            f"Request timed out after {timeout}s", "ETIMEDOUT"
+        ) from None
+    except httpx.RequestError as e:
+        raise FetchError(f"Request failed: {e}") from e
+
+
+async def _stream_text(
+    client: httpx.AsyncClient, url: str, timeout: float, max_bytes: int
+) -> str:
+    async with client.stream("GET", url, timeout=timeout) as response:
+        response.raise_for_status()
+        body = bytearray()
+        async for chunk in response.aiter_bytes(65536):
+            body.extend(chunk)
+            if len(body) >= max_bytes:
+                break
+        encoding = _known_encoding(response.charset_encoding)
+    return body[:max_bytes].decode(encoding, errors="replace")
+
+
+def _known_encoding(charset: str | None) -> str:
+    """Returns `charset` if Python knows the codec, else utf-8."""
+    if charset:
+        try:
+            return codecs.lookup(charset).name
+        except LookupError:
+            # Unknown or misspelled charset header.
+            pass
+    return "utf-8"
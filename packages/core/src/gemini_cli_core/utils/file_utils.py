@@ -1,47 +1,50 @@
+import asyncio
+import binascii
 import mimetypes
+import os
+import stat
 from collections import deque
+from itertools import islice
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, BinaryIO, Literal
 
-import aiofiles
 from pydantic import BaseModel
 
 from gemini_cli_core.services.file_discovery import FileDiscoveryService
+from gemini_cli_core.utils.cache import lru_cache
 
 DEFAULT_ENCODING = "utf-8"
 MAX_LINE_LENGTH_TEXT_FILE = 2000
 DEFAULT_MAX_LINES_TEXT_FILE = 2000
+# Caps concurrent directory listings so deep trees don't exhaust FDs.
+MAX_CONCURRENT_DIR_SCANS = 64
 
 FileType = Literal["text", "image", "pdf", "binary"]
 
+# Bytes that count as printable for binary sniffing: tab, LF, CR and >= 32.
+_PRINTABLE_BYTES = b"\t\n\r" + bytes(range(32, 256))
+
 
 def is_binary_file(file_path: Path) -> bool:
     """Checks if a file is likely binary by inspecting its first few bytes."""
     try:
         with file_path.open("rb") as f:
             chunk = f.read(4096)
+            if not chunk:
+                return False
             if b"\0" in chunk:
                 return True
-            # Simple heuristic: check for a high percentage of non-printable ASCII
-            non_printable = sum(
-                1 for byte in chunk if byte < 32 and byte not in {9, 10, 13}
-            )
-            return non_printable / len(chunk) > 0.3 if chunk else False
+            # Simple heuristic: check for a high percentage of non-printable
+            # ASCII. Deleting the printable bytes in C leaves only the rest.
+            non_printable = len(chunk.translate(None, _PRINTABLE_BYTES))
+            return non_printable / len(chunk) > 0.3
     except Exception:
         return False
 
 
-def detect_file_type(file_path: Path) -> FileType:
-    """Detects the type of a file based on its extension and content."""
-    mime_type, _ = mimetypes.guess_type(file_path)
-    if mime_type:
-        if mime_type.startswith("image/"):
-            return "image"
-        if mime_type == "application/pdf":
-            return "pdf"
-
-    # Known binary extensions
-    binary_extensions = {
+# Known binary extensions
+BINARY_EXTENSIONS: frozenset[str] = frozenset(
+    {
         ".zip",
         ".tar",
         ".gz",
@@ -71,8 +74,31 @@ def detect_file_type(file_path: Path) -> FileType:
         ".pyc",
         ".pyo",
     }
-    if file_path.suffix.lower() in binary_extensions:
+)
+
+# Load the platform MIME tables once, up front.
+mimetypes.init()
+
+
+@lru_cache(maxsize=4096)
+def _type_from_suffix(suffix: str) -> FileType | None:
+    """Classifies a lower-cased extension, or None if content must decide."""
+    mime_type, _ = mimetypes.guess_type(f"file{suffix}")
+    if mime_type:
+        if mime_type.startswith("image/"):
+            return "image"
+        if mime_type == "application/pdf":
+            return "pdf"
+    if suffix in BINARY_EXTENSIONS:
         return "binary"
+    return None
+
+
+def detect_file_type(file_path: Path) -> FileType:
+    """Detects the type of a file based on its extension and content."""
+    file_type = _type_from_suffix(file_path.suffix.lower())
+    if file_type is not None:
+        return file_type
 
     if is_binary_file(file_path):
         return "binary"
@@ -80,6 +106,25 @@ def detect_file_type(file_path: Path) -> FileType:
     return "text"
 
 
+# A multiple of 3, so every full chunk encodes to base64 without padding.
+_ENCODE_CHUNK_SIZE = 3 * 64 * 1024
+
+
+def encode_base64_stream(f: BinaryIO, size: int) -> str:
+    """Base64-encodes a file in chunks into a buffer sized up front."""
+    out = bytearray(((size + 2) // 3) * 4)
+    pos = 0
+    while chunk := f.read(_ENCODE_CHUNK_SIZE):
+        encoded = binascii.b2a_base64(chunk, newline=False)
+        end = pos + len(encoded)
+        # Same-length slice assignment fills in place; it only grows the
+        # buffer if the file grew after it was sized.
+        out[pos:end] = encoded
+        pos = end
+    del out[pos:]
+    return out.decode("ascii")
+
+
 class ProcessedFileReadResult(BaseModel):
     llm_content: Any
     return_display: str
@@ -89,6 +134,84 @@ class ProcessedFileReadResult(BaseModel):
     lines_shown: tuple[int, int] | None = None
 
 
+def _process_single_file_sync(
+    file_path: Path, offset: int, limit: int | None
+) -> ProcessedFileReadResult:
+    """Synchronous body of process_single_file_content, run in a thread."""
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        return ProcessedFileReadResult(
+            llm_content="",
+            return_display="File not found.",
+            error=f"File not found: {file_path}",
+        )
+    if stat.S_ISDIR(st.st_mode):
+        return ProcessedFileReadResult(
+            llm_content="",
+            return_display="Path is a directory.",
+            error=f"Path is a directory: {file_path}",
+        )
+
+    file_type = detect_file_type(file_path)
+
+    if file_type == "binary":
+        return ProcessedFileReadResult(
+            llm_content="",
+            return_display=f"Skipped binary file: {file_path.name}",
+        )
+
+    if file_type in ("image", "pdf"):
+        with open(file_path, "rb") as f:
+            encoded_content = encode_base64_stream(f, st.st_size)
+        mime_type, _ = mimetypes.guess_type(file_path)
+        return ProcessedFileReadResult(
+            llm_content={
+                "inlineData": {
+                    "data": encoded_content,
+                    "mimeType": mime_type or "application/octet-stream",
+                }
+            },
+            return_display=f"Read {file_type} file: {file_path.name}",
+        )
+
+    # It's a text file. Lines in the requested window are truncated as they
+    # are read; the rest are only counted.
+    limit = limit or DEFAULT_MAX_LINES_TEXT_FILE
+    lines_were_truncated_in_length = False
+    formatted_lines: list[str] = []
+    with open(file_path, encoding="utf-8", errors="ignore") as f:
+        actual_start_line = sum(1 for _ in islice(f, offset))
+        for line in islice(f, limit):
+            if len(line) > MAX_LINE_LENGTH_TEXT_FILE:
+                lines_were_truncated_in_length = True
+                line = line[:MAX_LINE_LENGTH_TEXT_FILE] + "... [truncated]\n"
+            formatted_lines.append(line)
+        end_line = actual_start_line + len(formatted_lines)
+        original_line_count = end_line + sum(1 for _ in f)
+
+    content_range_truncated = end_line < original_line_count
+    is_truncated = content_range_truncated or lines_were_truncated_in_length
+    llm_text_content = ""
+    if content_range_truncated:
+        llm_text_content += f"[File content truncated: showing lines {actual_start_line + 1}-{end_line} of {original_line_count} total lines. Use offset/limit parameters to view more.]\n"
+    elif lines_were_truncated_in_length:
+        llm_text_content += f"[File content partially truncated: some lines exceeded maximum length of {MAX_LINE_LENGTH_TEXT_FILE} characters.]\n"
+
+    llm_text_content += "".join(formatted_lines)
+    display_message = f"Read lines {actual_start_line + 1}-{end_line} of {original_line_count} from {file_path.name}"
+    if is_truncated:
+        display_message += " (truncated)"
+
+    return ProcessedFileReadResult(
+        llm_content=llm_text_content,
+        return_display=display_message,
+        is_truncated=is_truncated,
+        original_line_count=original_line_count,
+        lines_shown=(actual_start_line + 1, end_line),
+    )
+
+
 async def process_single_file_content(
     file_path: Path,
     root_directory: Path,
@@ -97,90 +220,10 @@ async def process_single_file_content(
 ) -> ProcessedFileReadResult:
     """Reads and processes a single file, handling text, images, and PDFs."""
     try:
-        if not await aiofiles.os.path.exists(file_path):
-            return ProcessedFileReadResult(
-                llm_content="",
-                return_display="File not found.",
-                error=f"File not found: {file_path}",
-            )
-        if await aiofiles.os.path.isdir(file_path):
-            return ProcessedFileReadResult(
-                llm_content="",
-                return_display="Path is a directory.",
-                error=f"Path is a directory: {file_path}",
-            )
-
-        file_type = detect_file_type(file_path)
-
-        if file_type == "binary":
-            return ProcessedFileReadResult(
-                llm_content="",
-                return_display=f"Skipped binary file: {file_path.name}",
-            )
-
-        if file_type in ("image", "pdf"):
-            async with aiofiles.open(file_path, "rb") as f:
-                import base64
-
-                encoded_content = base64.b64encode(await f.read()).decode(
-                    "utf-8"
-                )
-            mime_type, _ = mimetypes.guess_type(file_path)
-            return ProcessedFileReadResult(
-                llm_content={
-                    "inlineData": {
-                        "data": encoded_content,
-                        "mimeType": mime_type or "application/octet-stream",
-                    }
-                },
-                return_display=f"Read {file_type} file: {file_path.name}",
-            )
-
-        # It's a text file
-        async with aiofiles.open(
-            file_path, encoding="utf-8", errors="ignore"
-        ) as f:
-            lines = await f.readlines()
-
-        original_line_count = len(lines)
-        limit = limit or DEFAULT_MAX_LINES_TEXT_FILE
-        # Ensure selected_lines doesn't try to slice beyond array bounds
-        actual_start_line = min(offset, original_line_count)
-        end_line = min(actual_start_line + limit, original_line_count)
-        selected_lines = lines[actual_start_line:end_line]
-
-        lines_were_truncated_in_length = False
-        formatted_lines = []
-        for line in selected_lines:
-            if len(line) > MAX_LINE_LENGTH_TEXT_FILE:
-                lines_were_truncated_in_length = True
-                formatted_lines.append(
-                    line[:MAX_LINE_LENGTH_TEXT_FILE] + "... [truncated]\n"
-                )
-            else:
-                formatted_lines.append(line)
-
-        content_range_truncated = end_line < original_line_count
-        is_truncated = content_range_truncated or lines_were_truncated_in_length
-        llm_text_content = ""
-        if content_range_truncated:
-            llm_text_content += f"[File content truncated: showing lines {actual_start_line + 1}-{end_line} of {original_line_count} total lines. Use offset/limit parameters to view more.]\n"
-        elif lines_were_truncated_in_length:
-            llm_text_content += f"[File content partially truncated: some lines exceeded maximum length of {MAX_LINE_LENGTH_TEXT_FILE} characters.]\n"
-
-        llm_text_content += "".join(formatted_lines)
-        display_message = f"Read lines {actual_start_line + 1}-{end_line} of {original_line_count} from {file_path.name}"
-        if is_truncated:
-            display_message += " (truncated)"
-
-        return ProcessedFileReadResult(
-            llm_content=llm_text_content,
-            return_display=display_message,
-            is_truncated=is_truncated,
-            original_line_count=original_line_count,
-            lines_shown=(actual_start_line + 1, end_line),
+        # One thread hop for the stat, type sniff and read together.
+        return await asyncio.to_thread(
+            _process_single_file_sync, file_path, offset, limit
         )
-
     except Exception as e:
         return ProcessedFileReadResult(
             llm_content="",
@@ -189,6 +232,15 @@ async def process_single_file_content(
         )
 
 
+def _scan_dir_sync(path: str) -> list[tuple[str, str, bool, bool]]:
+    """Lists a directory as (name, path, is_dir, is_file) tuples."""
+    with os.scandir(path) as it:
+        return [
+            (entry.name, entry.path, entry.is_dir(), entry.is_file())
+            for entry in it
+        ]
+
+
 async def bfs_file_search(
     root_dir: Path,
     file_name: str,
@@ -197,33 +249,56 @@ async def bfs_file_search(
     max_dirs: int = 1000,
 ) -> list[Path]:
     """Performs a breadth-first search for a specific file."""
+    # Directories are tracked as plain strings; Path objects are only built
+    # for the files that are returned.
+    root = os.fspath(root_dir)
+    root_prefix_len = len(os.path.join(root, ""))
     found_files: list[Path] = []
-    queue: deque[Path] = deque([root_dir])
-    visited: set[Path] = set()
+    queue: deque[str] = deque([root])
+    visited: set[str] = set()
     scanned_dir_count = 0
-    ignore_dirs = ignore_dirs or []
+    ignored_names = set(ignore_dirs or ())
+    semaphore = asyncio.BoundedSemaphore(MAX_CONCURRENT_DIR_SCANS)
+    is_git_ignored = file_service.get_git_ignore_matcher()
+
+    async def scan(directory: str) -> list[tuple[str, str, bool, bool]]:
+        async with semaphore:
+            try:
+                # The whole listing, including the type checks, happens in
+                # one worker thread.
+                return await asyncio.to_thread(_scan_dir_sync, directory)
+            except OSError:
+                return []
 
     while queue and scanned_dir_count < max_dirs:
-        current_dir = queue.popleft()
-        if current_dir in visited:
-            continue
-        visited.add(current_dir)
-        scanned_dir_count += 1
-
-        try:
-            entries = await aiofiles.os.scandir(current_dir)
-            for entry in entries:
-                full_path = Path(entry.path)
-                if file_service.should_git_ignore_file(
-                    str(full_path.relative_to(root_dir))
-                ):
+        # Take the current level (within the remaining budget) and list its
+        # directories concurrently.
+        level: list[str] = []
+        while queue and scanned_dir_count + len(level) < max_dirs:
+            current_dir = queue.popleft()
+            if current_dir in visited:
+                continue
+            visited.add(current_dir)
+            level.append(current_dir)
+        scanned_dir_count += len(level)
+
+        for entries in await asyncio.gather(*(scan(d) for d in level)):
+            for name, path, is_dir, is_file in entries:
+                # Only matching files and unignored directories matter; skip
+                # everything else before the costlier gitignore match.
+                if is_dir:
+                    if name in ignored_names:
+                        continue
+                elif not (is_file and name == file_name):
+                    continue
+
+                # Every scanned path is root joined with its relative part.
+                if is_git_ignored(path[root_prefix_len:]):
                     continue
 
-                if entry.is_dir() and entry.name not in ignore_dirs:
-                    queue.append(full_path)
-                elif entry.is_file() and entry.name == file_name:
-                    found_files.append(full_path)
-        except OSError:
-            continue
+                if is_dir:
+                    queue.append(path)
+                else:
+                    found_files.append(Path(path))
 
     return found_files
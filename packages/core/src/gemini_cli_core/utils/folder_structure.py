@@ -1,8 +1,9 @@
+import asyncio
+import os
+from collections import deque
+from dataclasses import dataclass, field
 from pathlib import Path
 
-import aiofiles
-from pydantic import BaseModel
-
 from gemini_cli_core.services.file_discovery import FileDiscoveryService
 
 MAX_ITEMS = 200
@@ -10,42 +11,48 @@ TRUNCATION_INDICATOR = "..."
 DEFAULT_IGNORED_FOLDERS = {"node_modules", ".git", "dist"}
 
 
-class FolderInfo(BaseModel):
+# Internal tree node only; a slotted dataclass avoids pydantic validation per
+# directory.
+@dataclass(slots=True)
+class FolderInfo:
     name: str
-    path: Path
-    files: list[str] = []
-    sub_folders: list["FolderInfo"] = []
+    path: str
+    files: list[str] = field(default_factory=list)
+    sub_folders: list["FolderInfo"] = field(default_factory=list)
     has_more_files: bool = False
     has_more_subfolders: bool = False
     is_ignored: bool = False
 
 
-async def _read_full_structure(
+def _read_full_structure_sync(
     root_path: Path,
     max_items: int,
     ignored_folders: set[str],
     file_service: FileDiscoveryService,
 ) -> FolderInfo | None:
-    root_node = FolderInfo(name=root_path.name, path=root_path)
-    queue = [(root_node, root_path)]
+    root = os.fspath(root_path)
+    root_node = FolderInfo(name=root_path.name, path=root)
+    # Paths stay plain strings throughout the walk.
+    queue: deque[tuple[FolderInfo, str]] = deque([(root_node, root)])
     item_count = 1  # Start with 1 for the root directory itself
     processed_paths = set()
+    is_git_ignored = file_service.get_git_ignore_matcher()
 
     while queue:
-        folder_info, current_path = queue.pop(0)
+        folder_info, current_path = queue.popleft()
 
         if current_path in processed_paths:
             continue
         processed_paths.add(current_path)
 
-        if item_count >= max_items and folder_info != root_node:
+        if item_count >= max_items and folder_info is not root_node:
             continue
 
         try:
-            entries = await aiofiles.os.scandir(current_path)
-            sorted_entries = sorted(entries, key=lambda e: e.name)
+            with os.scandir(current_path) as entries:
+                sorted_entries = sorted(entries, key=lambda e: e.name)
         except (OSError, PermissionError) as e:
-            if current_path == root_path:
+            if current_path == root:
                 return None  # Cannot read root
             print(f"Warning: Could not read directory {current_path}: {e}")
             continue
@@ -59,7 +66,7 @@ async def _read_full_structure(
                 if item_count >= max_items:
                     folder_info.has_more_files = True
                     break
-                if not file_service.should_git_ignore_file(entry.path):
+                if not is_git_ignored(entry.path):
                     files_in_dir.append(entry.name)
                     item_count += 1
         folder_info.files = files_in_dir
@@ -71,24 +78,44 @@ async def _read_full_structure(
                     folder_info.has_more_subfolders = True
                     break
 
-                is_git_ignored = file_service.should_git_ignore_file(entry.path)
-                is_explicitly_ignored = entry.name in ignored_folders
+                # The name check is a set lookup; only fall back to the
+                # gitignore match when it misses.
+                is_ignored = entry.name in ignored_folders or is_git_ignored(
+                    entry.path
+                )
 
                 sub_folder_info = FolderInfo(
                     name=entry.name,
-                    path=Path(entry.path),
-                    is_ignored=(is_git_ignored or is_explicitly_ignored),
+                    path=entry.path,
+                    is_ignored=is_ignored,
                 )
                 subfolders_in_dir.append(sub_folder_info)
                 item_count += 1
 
                 if not sub_folder_info.is_ignored:
-                    queue.append((sub_folder_info, Path(entry.path)))
+                    queue.append((sub_folder_info, entry.path))
         folder_info.sub_folders = subfolders_in_dir
 
     return root_node
 
 
+async def _read_full_structure(
+    root_path: Path,
+    max_items: int,
+    ignored_folders: set[str],
+    file_service: FileDiscoveryService,
+) -> FolderInfo | None:
+    # The whole BFS runs in one worker thread rather than hopping to the
+    # executor once per directory.
+    return await asyncio.to_thread(
+        _read_full_structure_sync,
+        root_path,
+        max_items,
+        ignored_folders,
+        file_service,
+    )
+
+
 def _format_structure_recursive(
     node: FolderInfo,
     builder: list[str],
@@ -107,20 +134,16 @@ def _format_structure_recursive(
     if is_root:
         child_indent = ""
 
-    children = node.files + node.sub_folders
-    total_children = len(children)
-
     # Format files
+    has_folders_after = bool(node.sub_folders or node.has_more_subfolders)
+    last_file_index = len(node.files) - 1
     for i, file_name in enumerate(node.files):
-        is_last_item = (i == len(node.files) - 1) and not (
-            node.sub_folders or node.has_more_subfolders
-        )
+        is_last_item = i == last_file_index and not has_folders_after
         file_connector = "└───" if is_last_item else "├───"
         builder.append(f"{child_indent}{file_connector}{file_name}")
 
     if node.has_more_files:
-        is_last_item = not (node.sub_folders or node.has_more_subfolders)
-        file_connector = "└───" if is_last_item else "├───"
+        file_connector = "├───" if has_folders_after else "└───"
         builder.append(f"{child_indent}{file_connector}{TRUNCATION_INDICATOR}")
 
     # Format subfolders
@@ -1,17 +1,36 @@
+import os
+import time
 from pathlib import Path
 
 import pathspec
 
+from gemini_cli_core.utils.cache import lru_cache, ttl_cache
 
-def find_git_root(start_dir: str | Path) -> Path | None:
-    """Finds the root directory of a git repository."""
-    current_dir = Path(start_dir).resolve()
+# How long a loaded .gitignore is trusted before it is read again.
+GITIGNORE_TTL_SECONDS = 60
+
+
+# A short TTL so a repository created (or removed) while the process runs is
+# picked up.
+@ttl_cache(maxsize=1024, ttl_seconds=5)
+def _find_git_root_cached(abs_path: str) -> str | None:
+    """Walks up from a resolved path; the result is cached briefly per path."""
+    current_dir = abs_path
     while True:
-        if (current_dir / ".git").exists():
+        # `.git` may be a file (worktrees, submodules), so test existence
+        # rather than isdir.
+        if os.path.exists(os.path.join(current_dir, ".git")):
             return current_dir
-        if current_dir.parent == current_dir:  # Reached the filesystem root
+        parent = os.path.dirname(current_dir)
+        if parent == current_dir:  # Reached the filesystem root
             return None
-        current_dir = current_dir.parent
+        current_dir = parent
+
+
+def find_git_root(start_dir: str | Path) -> Path | None:
+    """Finds the root directory of a git repository."""
+    root = _find_git_root_cached(str(Path(start_dir).resolve()))
+    return Path(root) if root is not None else None
 
 
 def is_git_repository(directory: str | Path) -> bool:
@@ -25,43 +44,75 @@ class GitIgnoreParser:
     def __init__(self, project_root: str | Path):
         self.project_root = Path(project_root).resolve()
         self._spec: pathspec.PathSpec | None = None
+        self._spec_expires_at = 0.0
         self._patterns: list[str] = []
+        # Patterns given to add_patterns, kept across reloads.
+        self._added_patterns: list[str] = []
+        # Per-instance memo of match results keyed on the relative path.
+        self._match_relative = lru_cache(maxsize=65536)(self._match_uncached)
 
     @property
     def spec(self) -> pathspec.PathSpec:
-        """Lazily loads and returns the pathspec."""
-        if self._spec is None:
-            self._load_all_patterns()
+        """
+        Lazily loads and returns the pathspec, reloading the ignore files
+        once GITIGNORE_TTL_SECONDS have passed.
+        """
+        self._ensure_current()
         return self._spec
 
+    def _ensure_current(self):
+        """Loads the patterns if they were never loaded or have expired."""
+        if self._spec is None or time.monotonic() >= self._spec_expires_at:
+            self._load_all_patterns()
+
     def _load_all_patterns(self):
-        """Loads all gitignore patterns."""
-        self.add_patterns([".git"])  # Always ignore .git
+        """Loads all gitignore patterns and compiles them once."""
+        patterns = [".git"]  # Always ignore .git
         if is_git_repository(self.project_root):
-            self._load_patterns_from_file(self.project_root / ".gitignore")
-            self._load_patterns_from_file(
+            patterns += self._read_patterns_from_file(
+                self.project_root / ".gitignore"
+            )
+            patterns += self._read_patterns_from_file(
                 self.project_root / ".git" / "info" / "exclude"
             )
+        # Added patterns come last so they take precedence over the files.
+        self._patterns = patterns + self._added_patterns
         self._spec = pathspec.PathSpec.from_lines(
             "gitwildmatch", self._patterns
         )
+        self._spec_expires_at = time.monotonic() + GITIGNORE_TTL_SECONDS
+        self._match_relative.cache_clear()
 
-    def _load_patterns_from_file(self, file_path: Path):
-        """Loads patterns from a single file."""
-        if file_path.is_file():
-            with file_path.open("r", encoding="utf-8") as f:
-                patterns = [
-                    line.strip()
-                    for line in f
-                    if line.strip() and not line.startswith("#")
-                ]
-                self.add_patterns(patterns)
+    @staticmethod
+    def _read_patterns_from_file(file_path: Path) -> list[str]:
+        """Reads patterns from a single file."""
+        try:
+            data = file_path.read_bytes()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return []
+        # Decode once and split in C; strip each line only once.
+        return [
+            line
+            for raw in data.decode("utf-8", "replace").split("\n")
+            if (line := raw.strip()) and not line.startswith("#")
+        ]
 
     def add_patterns(self, patterns: list[str]):
         """Adds patterns to the parser."""
+        self._added_patterns.extend(patterns)
         self._patterns.extend(patterns)
-        # Invalidate spec cache if new patterns are added after initial load
-        self._spec = None
+        if self._spec is None:
+            # Not loaded yet; compiled together with the files on first use.
+            return
+        # Compile only the new patterns and append them to the loaded spec.
+        added = pathspec.PathSpec.from_lines("gitwildmatch", patterns)
+        self._spec = pathspec.PathSpec(
+            list(self._spec.patterns) + list(added.patterns)
+        )
+        self._match_relative.cache_clear()
+
+    def _match_uncached(self, relative_path: str) -> bool:
+        return self.spec.match_file(relative_path)
 
     def is_ignored(self, file_path: str | Path) -> bool:
         """Checks if a given file path is ignored."""
@@ -75,10 +126,11 @@ class GitIgnoreParser:
                 # Path is outside the project root, not ignored by this context.
                 return False
 
-        return self.spec.match_file(str(relative_path))
+        # Reloading clears the memo, so stale results are never returned.
+        self._ensure_current()
+        return self._match_relative(str(relative_path))
 
     def get_patterns(self) -> list[str]:
         """Returns all loaded patterns."""
-        if self._spec is None:  # Ensure patterns are loaded
-            self._load_all_patterns()
+        self._ensure_current()
         return self._patterns
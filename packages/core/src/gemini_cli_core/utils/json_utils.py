@@ -0,0 +1,47 @@
+import json
+from collections.abc import Callable
+from typing import Any
+
+__all__ = ["dumps", "dumps_indented", "loads"]
+
+# orjson is considerably faster for large payloads, but stays optional.
+# Its decode error subclasses json.JSONDecodeError, so callers can catch
+# that with either backend.
+try:
+    import orjson
+
+    def dumps(
+        value: Any, *, default: Callable[[Any], Any] | None = None
+    ) -> bytes:
+        """Serializes `value` to compact UTF-8 JSON."""
+        return orjson.dumps(value, default=default)
+
+    def dumps_indented(
+        value: Any, *, default: Callable[[Any], Any] | None = None
+    ) -> str:
+        """Serializes `value` to JSON indented by two spaces."""
+        return orjson.dumps(
+            value,
+            default=default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+
+    loads = orjson.loads
+
+except ImportError:
+
+    def dumps(
+        value: Any, *, default: Callable[[Any], Any] | None = None
+    ) -> bytes:
+        """Serializes `value` to compact UTF-8 JSON."""
+        return json.dumps(
+            value, separators=(",", ":"), default=default
+        ).encode("utf-8")
+
+    def dumps_indented(
+        value: Any, *, default: Callable[[Any], Any] | None = None
+    ) -> str:
+        """Serializes `value` to JSON indented by two spaces."""
+        return json.dumps(value, indent=2, default=default)
+
+    loads = json.loads
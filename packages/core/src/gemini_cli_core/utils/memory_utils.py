@@ -1,10 +1,11 @@
+import asyncio
 import logging
+import os
 import re
+import threading
 from pathlib import Path
 from typing import Any
 
-import aiofiles
-
 from gemini_cli_core.tools.memory.memory_tool import (
     DEFAULT_CONTEXT_FILENAME,
     get_global_memory_file_path,
@@ -15,6 +16,37 @@ from .git_utils import find_git_root
 
 logger = logging.getLogger(__name__)
 MAX_DIRECTORIES_TO_SCAN_FOR_MEMORY = 200
+MAX_CONCURRENT_MEMORY_READS = 32
+_IMPORT_RE = re.compile(r"@([./]?[^\s\n]+\.md)")
+
+# Memory file text keyed by (path, mtime_ns, size); a changed file gets a new
+# key, so stale entries simply age out.
+MAX_MEMORY_CACHE_SIZE = 256
+_memory_file_cache: dict[tuple[Path, int, int], str] = {}
+# Reads run in up to MAX_CONCURRENT_MEMORY_READS worker threads at once.
+_memory_file_cache_lock = threading.Lock()
+
+
+def _read_memory_file_sync(path: Path) -> str:
+    """Reads a memory file, reusing the cached text while it is unchanged."""
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+    with _memory_file_cache_lock:
+        content = _memory_file_cache.pop(key, None)
+        if content is not None:
+            _memory_file_cache[key] = content
+            return content
+    # Read outside the lock so slow files do not serialize the others.
+    content = path.read_text(encoding="utf-8")
+    with _memory_file_cache_lock:
+        _memory_file_cache[key] = content
+        while len(_memory_file_cache) > MAX_MEMORY_CACHE_SIZE:
+            del _memory_file_cache[next(iter(_memory_file_cache))]
+    return content
+
+
+async def _read_memory_file(path: Path) -> str:
+    return await asyncio.to_thread(_read_memory_file_sync, path)
 
 
 class ImportState:
@@ -33,13 +65,15 @@ async def process_imports(
     state: ImportState | None = None,
 ) -> str:
     """Recursively processes @-imports in memory files."""
+    # Most memory files import nothing; skip the regex pass for them.
+    if "@" not in content:
+        return content
+
     state = state or ImportState()
     if state.current_depth >= state.max_depth:
         logger.warning("Maximum import depth reached.")
         return content
 
-    import_regex = re.compile(r"@([./]?[^\s\n]+\.md)")
-
     async def replace_match(match: re.Match) -> str:
         import_path_str = match.group(1)
         full_path = (base_path / import_path_str).resolve()
@@ -58,8 +92,7 @@ async def process_imports(
             return f"<!-- Circular import detected: {import_path_str} -->"
 
         try:
-            async with aiofiles.open(full_path, encoding="utf-8") as f:
-                imported_content = await f.read()
+            imported_content = await _read_memory_file(full_path)
 
             new_state = ImportState(max_depth=state.max_depth)
             new_state.processed_files = state.processed_files | {full_path}
@@ -74,15 +107,21 @@ async def process_imports(
         except Exception as e:
             return f"<!-- Import failed: {e} -->"
 
-    # A simple sequential replacement. For concurrent, would need a more complex approach.
-    processed_content = content
-    for match in import_regex.finditer(content):
-        replacement = await replace_match(match)
-        processed_content = processed_content.replace(
-            match.group(0), replacement, 1
-        )
+    matches = list(_IMPORT_RE.finditer(content))
+    if not matches:
+        return content
 
-    return processed_content
+    # Imports are independent, so resolve them concurrently, then splice the
+    # replacements in by span in a single pass.
+    replacements = await asyncio.gather(*(replace_match(m) for m in matches))
+    parts: list[str] = []
+    pos = 0
+    for match, replacement in zip(matches, replacements):
+        parts.append(content[pos : match.start()])
+        parts.append(replacement)
+        pos = match.end()
+    parts.append(content[pos:])
+    return "".join(parts)
 
 
 async def _get_gemini_md_file_paths(cwd: Path, file_service) -> list[Path]:
@@ -127,11 +166,12 @@ async def load_server_hierarchical_memory(
     if not file_paths:
         return {"memory_content": "", "file_count": 0}
 
-    contents = []
-    for p in file_paths:
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_MEMORY_READS)
+
+    async def load(p: Path) -> str | None:
         try:
-            async with aiofiles.open(p, encoding="utf-8") as f:
-                content = await f.read()
+            async with semaphore:
+                content = await _read_memory_file(p)
             processed_content = await process_imports(
                 content, p.parent, project_root
             )
@@ -143,11 +183,14 @@ async def load_server_hierarchical_memory(
                     p.name
                 )  # Fallback for global memory files outside cwd
 
-            contents.append(
-                f"--- Context from: {relative_path} ---\n{processed_content}\n--- End Context ---"
-            )
+            return f"--- Context from: {relative_path} ---\n{processed_content}\n--- End Context ---"
         except Exception as e:
             logger.warning(f"Could not read memory file {p}: {e}")
+            return None
+
+    # Files load concurrently; gather keeps them in path order.
+    loaded = await asyncio.gather(*(load(p) for p in file_paths))
+    contents = [c for c in loaded if c is not None]
 
     return {
         "memory_content": "\n\n".join(contents),
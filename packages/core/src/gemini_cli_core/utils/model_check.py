@@ -1,5 +1,6 @@
 import logging
 import re
+import time
 from typing import Any
 
 import httpx
@@ -8,20 +9,23 @@ from gemini_cli_core.config.models import (
     DEFAULT_GEMINI_FLASH_MODEL,
     DEFAULT_GEMINI_MODEL,
 )
+from gemini_cli_core.utils.fetch import get_shared_client
 
 logger = logging.getLogger(__name__)
 
 # 支持的模型列表
-SUPPORTED_MODELS = [
-    "gemini-2.0-flash-exp",
-    "gemini-2.0-flash",
-    "gemini-1.5-pro",
-    "gemini-1.5-pro-latest",
-    "gemini-1.5-flash",
-    "gemini-1.5-flash-latest",
-    "gemini-1.0-pro",
-    "gemini-1.0-pro-latest",
-]
+SUPPORTED_MODELS = frozenset(
+    {
+        "gemini-2.0-flash-exp",
+        "gemini-2.0-flash",
+        "gemini-1.5-pro",
+        "gemini-1.5-pro-latest",
+        "gemini-1.5-flash",
+        "gemini-1.5-flash-latest",
+        "gemini-1.0-pro",
+        "gemini-1.0-pro-latest",
+    }
+)
 
 # 模型别名映射
 MODEL_ALIASES = {
@@ -32,6 +36,14 @@ MODEL_ALIASES = {
     "1.0": "gemini-1.0-pro-latest",
 }
 
+# 模型名称解析正则
+_MODEL_RE = re.compile(r"gemini-(\d+\.\d+)-(\w+)(?:-(latest|exp))?")
+
+
+# Probe outcomes per (api_key, model), reused for EFFECTIVE_MODEL_TTL seconds.
+EFFECTIVE_MODEL_TTL = 60.0
+_effective_model_cache: dict[tuple[str, str], tuple[float, str]] = {}
+
 
 async def get_effective_model(
     api_key: str, current_configured_model: str
@@ -45,6 +57,11 @@ async def get_effective_model(
         # we want to fallback from.
         return current_configured_model
 
+    cache_key = (api_key, current_configured_model)
+    cached = _effective_model_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < EFFECTIVE_MODEL_TTL:
+        return cached[1]
+
     model_to_test = DEFAULT_GEMINI_MODEL
     fallback_model = DEFAULT_GEMINI_FLASH_MODEL
     endpoint = f"https://generativelanguage.googleapis.com/v1beta/models/{model_to_test}:generateContent?key={api_key}"
@@ -59,18 +76,23 @@ async def get_effective_model(
     }
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(endpoint, json=body, timeout=2.0)
+        # The shared pool avoids a new connection (and TLS handshake) per
+        # probe; it is closed by the server's shutdown handler.
+        client = get_shared_client()
+        response = await client.post(endpoint, json=body, timeout=2.0)
 
         if response.status_code == 429:
             logger.info(
                 f"Your configured model ({model_to_test}) was temporarily unavailable. "
                 f"Switched to {fallback_model} for this session."
             )
-            return fallback_model
-
-        # For any other case, stick to the original model.
-        return current_configured_model
+            effective_model = fallback_model
+        else:
+            # For any other case, stick to the original model.
+            effective_model = current_configured_model
+        # Only answered probes are cached; errors are retried next time.
+        _effective_model_cache[cache_key] = (time.monotonic(), effective_model)
+        return effective_model
     except (TimeoutError, httpx.RequestError) as e:
         logger.debug(f"Error checking model endpoint, sticking to default: {e}")
         # On timeout or any other fetch error, stick to the original model.
@@ -119,8 +141,7 @@ def get_model_info(model: str) -> dict[str, Any]:
     }
 
     # 使用正则表达式解析模型名称
-    pattern = r"gemini-(\d+\.\d+)-(\w+)(?:-(latest|exp))?"
-    match = re.match(pattern, effective_model)
+    match = _MODEL_RE.match(effective_model)
 
     if match:
         info["version"] = match.group(1)
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import re
 
 from gemini_cli_core.core.app import GeminiClient
 from gemini_cli_core.core.graphs.states import ConversationState
@@ -50,6 +51,66 @@ RESPONSE_SCHEMA = {
 }
 
 
+# Appended to the history for the LLM fallback. Built once; the request
+# only reads it.
+_CHECK_PROMPT_CONTENTS: list[Content] = [
+    {"role": "user", "parts": [{"text": CHECK_PROMPT}]}
+]
+
+# Phrases that hand the turn back to the user when they close a response.
+_WAITING_FOR_USER_RE = re.compile(
+    r"(let me know|waiting for|please (provide|confirm))", re.IGNORECASE
+)
+# Phrases announcing an immediate next action the model has not taken yet.
+# Only matched at the start of the final sentence of the response.
+_MODEL_CONTINUES_RE = re.compile(
+    r"^(next, i will|now i(?:'ll| will)|moving on to|i'll now)\b",
+    re.IGNORECASE,
+)
+# An announced action that is itself waiting on the user is left to the LLM.
+_MENTIONS_WAITING_RE = re.compile(r"\bwait", re.IGNORECASE)
+# Sentence boundaries within the last line of a response.
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+# Only the end of a response is checked for the phrases above.
+_TAIL_CHARS = 200
+
+
+def _last_text(content: Content) -> str:
+    """Returns the concatenated text parts of a message, right-stripped."""
+    parts = content.get("parts", [])
+    return "".join(part.get("text") or "" for part in parts).rstrip()
+
+
+def _final_sentence(text: str) -> str:
+    """Returns the last sentence of the last line of `text`."""
+    last_line = text.rpartition("\n")[2].strip()
+    return _SENTENCE_END_RE.split(last_line)[-1]
+
+
+def _heuristic_next_speaker(last_text: str) -> NextSpeakerResponse | None:
+    """Decides obvious endings of a model turn without asking the LLM."""
+    if last_text.endswith("?"):
+        return NextSpeakerResponse(
+            reasoning="Last model turn ends with a question, so the user should speak next.",
+            next_speaker="user",
+        )
+    tail = last_text[-_TAIL_CHARS:]
+    if _WAITING_FOR_USER_RE.search(tail):
+        return NextSpeakerResponse(
+            reasoning="Last model turn ends by asking for user input, so the user should speak next.",
+            next_speaker="user",
+        )
+    final_sentence = _final_sentence(tail)
+    if _MODEL_CONTINUES_RE.match(
+        final_sentence
+    ) and not _MENTIONS_WAITING_RE.search(final_sentence):
+        return NextSpeakerResponse(
+            reasoning="Last model turn announces its next action, so the model should speak next.",
+            next_speaker="model",
+        )
+    return None
+
+
 def _is_function_response(content: Content) -> bool:
     """Checks if the content is a user message containing only function responses."""
     parts = content.get("parts", [])
@@ -78,6 +139,8 @@ async def check_next_speaker(
         return None
 
     last_comprehensive_message = comprehensive_history[-1]
+    last_role = last_comprehensive_message.get("role")
+    last_comprehensive_parts = last_comprehensive_message.get("parts")
 
     # Pre-check 1: If the last message is just tool responses, the model must go next.
     if _is_function_response(last_comprehensive_message):
@@ -87,9 +150,7 @@ async def check_next_speaker(
         )
 
     # Pre-check 2: If the model's last turn was empty, it should continue.
-    if last_comprehensive_message.get(
-        "role"
-    ) == "model" and not last_comprehensive_message.get("parts"):
+    if last_role == "model" and not last_comprehensive_parts:
         return NextSpeakerResponse(
             reasoning="Last message was an empty model turn, so the model should speak next.",
             next_speaker="model",
@@ -100,11 +161,19 @@ async def check_next_speaker(
     if last_curated_message.get("role") != "model":
         return None
 
+    # Obvious endings are decided locally, saving an LLM round-trip.
+    last_parts = last_curated_message.get("parts", [])
+    if any("function_call" in part for part in last_parts):
+        return NextSpeakerResponse(
+            reasoning="Last model turn contains a pending tool call, so the model should speak next.",
+            next_speaker="model",
+        )
+    heuristic = _heuristic_next_speaker(_last_text(last_curated_message))
+    if heuristic is not None:
+        return heuristic
+
     # Fallback to LLM to decide.
-    contents = [
-        *curated_history,
-        {"role": "user", "parts": [{"text": CHECK_PROMPT}]},
-    ]
+    contents = curated_history + _CHECK_PROMPT_CONTENTS
 
     try:
         result = await client.generate_json(
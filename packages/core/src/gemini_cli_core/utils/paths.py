@@ -1,16 +1,26 @@
 import hashlib
+import os
 from pathlib import Path
 
+from gemini_cli_core.utils.cache import lru_cache
+
 GEMINI_DIR = ".gemini"
 TMP_DIR_NAME = "tmp"
 
+# The home directory does not change during a session; resolve it once.
+_HOME = Path.home()
+_HOME_STR = str(_HOME)
+_HOME_PREFIX = os.path.join(_HOME_STR, "")
+
 
 def tildeify_path(p: Path) -> str:
     """Replaces the home directory with a tilde."""
-    home = Path.home()
-    if p.is_relative_to(home):
-        return f"~/{p.relative_to(home)}"
-    return str(p)
+    path_str = os.fspath(p)
+    if path_str.startswith(_HOME_PREFIX):
+        return f"~/{path_str[len(_HOME_PREFIX) :]}"
+    if path_str == _HOME_STR:
+        return "~/."
+    return path_str
 
 
 def shorten_path(file_path: str, max_len: int = 35) -> str:
@@ -18,10 +28,13 @@ def shorten_path(file_path: str, max_len: int = 35) -> str:
     if len(file_path) <= max_len:
         return file_path
 
-    p = Path(file_path)
-    # On Windows, p.parts might include the drive letter twice, e.g., ('C:', '\\', 'Users', ...).
-    # We filter out the root/anchor to handle this gracefully.
-    parts = [part for part in p.parts if part != p.anchor and part != "\\"]
+    # Split the string directly; building a Path just to read its parts
+    # costs more than the rest of the function. Empty and "." segments are
+    # dropped the same way pathlib normalizes them.
+    _, tail = os.path.splitdrive(file_path)
+    if os.altsep:
+        tail = tail.replace(os.altsep, os.sep)
+    parts = [part for part in tail.split(os.sep) if part and part != "."]
 
     if len(parts) <= 2:  # e.g., ['Users', 'test.txt']
         # Fallback to simple truncation from the beginning
@@ -34,7 +47,8 @@ def shorten_path(file_path: str, max_len: int = 35) -> str:
     ellipsis = "..."
     separator = "/"  # Use forward slash for consistent display
 
-    # Keep adding parts from the end until we exceed max_len
+    # Keep adding parts from the end until we exceed max_len. They are
+    # collected right to left and reversed once at the end.
     end_parts = [filename]
     current_len = (
         len(first_dir) + len(ellipsis) + len(filename) + 2
@@ -44,8 +58,9 @@ def shorten_path(file_path: str, max_len: int = 35) -> str:
         part = parts[i]
         if current_len + len(part) + 1 > max_len:
             break
-        end_parts.insert(0, part)
+        end_parts.append(part)
         current_len += len(part) + 1
+    end_parts.reverse()
 
     return f"{first_dir}{separator}{ellipsis}{separator}{separator.join(end_parts)}"
 
@@ -60,22 +75,47 @@ def make_relative(target_path: Path, root_directory: Path) -> str:
         return str(target_path)
 
 
+@lru_cache(maxsize=256)
+def resolve_tool_path(
+    file_path: str, root_directory: Path
+) -> tuple[Path, str, str]:
+    """
+    Returns `(path, relative_path, short_path)` for a tool's file path
+    argument, so validation, description and execution share one parse.
+    """
+    p = Path(file_path)
+    relative_path = make_relative(p, root_directory)
+    return p, relative_path, shorten_path(relative_path)
+
+
+@lru_cache(maxsize=128)
 def get_project_hash(project_root: str) -> str:
     """Generates a unique hash for a project based on its root path."""
     return hashlib.sha256(project_root.encode()).hexdigest()
 
 
+@lru_cache(maxsize=128)
 def get_project_temp_dir(project_root: str | Path) -> Path:
     """Generates a unique temporary directory path for a project."""
     hash_val = get_project_hash(str(project_root))
-    return Path.home() / GEMINI_DIR / TMP_DIR_NAME / hash_val
+    return _HOME / GEMINI_DIR / TMP_DIR_NAME / hash_val
+
+
+@lru_cache(maxsize=32)
+def _real_root(root_directory: str) -> str:
+    """
+    Resolves an absolute root directory once; roots rarely change in a
+    session. Keyed on absolute paths so a chdir can't make an entry stale.
+    """
+    return os.path.realpath(root_directory)
 
 
 def is_within_root(path_to_check: Path, root_directory: Path) -> bool:
     """Checks if a path is within a given root directory."""
+    root = _real_root(os.path.abspath(root_directory))
     try:
-        path_to_check.resolve().relative_to(root_directory.resolve())
-        return True
+        candidate = os.path.realpath(path_to_check)
+        return os.path.commonpath([candidate, root]) == root
     except ValueError:
         return False
 
@@ -1,31 +1,64 @@
 import asyncio
 import logging
 import random
+import re
+import time
 from collections.abc import Awaitable, Callable
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 from functools import wraps
 from typing import Any, TypeVar
 
 import httpx
 
-from .errors import report_error, to_friendly_error
+from .errors import (
+    BadRequestError,
+    ForbiddenError,
+    UnauthorizedError,
+    report_error,
+    to_friendly_error,
+)
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Wrapped API errors only carry the status in their message.
+_RETRYABLE_STATUS_RE = re.compile(r"\b(?:429|5\d\d)\b")
+_RATE_LIMITED_RE = re.compile(r"\b429\b")
+
+
+def _status_code(error: Exception) -> int | None:
+    """Returns the HTTP status carried by an error, if it has one."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code
+    for attr in ("status_code", "code"):
+        code = getattr(error, attr, None)
+        if isinstance(code, int):
+            return code
+    response = getattr(error, "response", None)
+    code = getattr(response, "status_code", None)
+    return code if isinstance(code, int) else None
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    code = _status_code(error)
+    if code is not None:
+        return code == 429
+    return _RATE_LIMITED_RE.search(str(error)) is not None
+
 
 def default_should_retry(error: Exception) -> bool:
     """Default predicate to check if a retry should be attempted."""
-    from .errors import BadRequestError, ForbiddenError, UnauthorizedError
-
     # Do not retry on user errors or auth errors
     if isinstance(error, (BadRequestError, UnauthorizedError, ForbiddenError)):
         return False
-    # A simple check for common transient errors, can be made more robust
-    if "429" in str(error) or "50" in str(error):
+    code = _status_code(error)
+    if code is not None:
+        return code == 429 or 500 <= code < 600
+    if isinstance(error, httpx.TransportError):
         return True
-    return False
+    return _RETRYABLE_STATUS_RE.search(str(error)) is not None
 
 
 def retry_with_backoff(
@@ -35,30 +68,50 @@ def retry_with_backoff(
     should_retry: Callable[[Exception], bool] = default_should_retry,
     on_persistent_429: Callable[[str], Awaitable[str | None]] | None = None,
     auth_type: str | None = None,
+    deadline_seconds: float | None = None,
+    concurrency: int | None = None,
 ) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
     """
-    A decorator to retry an async function with exponential backoff and jitter.
+    A decorator to retry an async function with decorrelated-jitter backoff.
+
+    Each delay is drawn uniformly between `initial_delay_ms` and three times
+    the previous delay, capped at `max_delay_ms`, so concurrent callers do
+    not retry in lockstep. If `deadline_seconds` is set, sleeps are clamped
+    so the retries never run past it. If `concurrency` is set, at most that
+    many calls of the decorated function are in flight at once; backoff
+    sleeps do not hold a slot.
     """
 
     def decorator(
         fn: Callable[..., Awaitable[T]],
     ) -> Callable[..., Awaitable[T]]:
+        semaphore = (
+            asyncio.Semaphore(concurrency) if concurrency is not None else None
+        )
+
+        async def call(*args: Any, **kwargs: Any) -> T:
+            if semaphore is None:
+                return await fn(*args, **kwargs)
+            async with semaphore:
+                return await fn(*args, **kwargs)
+
         @wraps(fn)
         async def wrapper(*args: Any, **kwargs: Any) -> T:
             attempt = 0
-            current_delay = initial_delay_ms
+            previous_delay = initial_delay_ms
+            started_at = time.monotonic()
             consecutive_429_count = 0
             last_error: Exception | None = None
 
             while attempt < max_attempts:
                 attempt += 1
                 try:
-                    return await fn(*args, **kwargs)
+                    return await call(*args, **kwargs)
                 except Exception as e:
                     friendly_error = to_friendly_error(e)
                     last_error = friendly_error
 
-                    if "429" in str(friendly_error):
+                    if _is_rate_limited(friendly_error):
                         consecutive_429_count += 1
                     else:
                         consecutive_429_count = 0
@@ -72,15 +125,16 @@ def retry_with_backoff(
                             fallback_model = await on_persistent_429(auth_type)
                             if fallback_model:
                                 logger.info(
-                                    f"Switched to fallback model: {fallback_model}"
+                                    "Switched to fallback model: %s",
+                                    fallback_model,
                                 )
                                 attempt = 0
                                 consecutive_429_count = 0
-                                current_delay = initial_delay_ms
+                                previous_delay = initial_delay_ms
                                 continue
                         except Exception as fallback_error:
                             logger.warning(
-                                f"Fallback handler failed: {fallback_error}"
+                                "Fallback handler failed: %s", fallback_error
                             )
 
                     if attempt >= max_attempts or not should_retry(
@@ -88,6 +142,14 @@ def retry_with_backoff(
                     ):
                         break
 
+                    remaining_seconds = float("inf")
+                    if deadline_seconds is not None:
+                        remaining_seconds = deadline_seconds - (
+                            time.monotonic() - started_at
+                        )
+                        if remaining_seconds <= 0:
+                            break
+
                     # Handle Retry-After header
                     retry_after_seconds = 0
                     if isinstance(e, httpx.HTTPStatusError):
@@ -95,15 +157,12 @@ def retry_with_backoff(
                             "retry-after"
                         )
                         if retry_after_header:
-                            try:
+                            retry_after_header = retry_after_header.strip()
+                            if retry_after_header.isdigit():
                                 retry_after_seconds = int(retry_after_header)
-                            except ValueError:
+                            else:
                                 # It might be an HTTP date, try to parse it
                                 try:
-                                    from email.utils import (
-                                        parsedate_to_datetime,
-                                    )
-
                                     retry_after_date = parsedate_to_datetime(
                                         retry_after_header
                                     )
@@ -114,29 +173,41 @@ def retry_with_backoff(
                                     retry_after_seconds = max(
                                         0, delay_delta.total_seconds()
                                     )
-                                except (ImportError, TypeError, ValueError):
+                                except (TypeError, ValueError):
                                     pass  # Failed to parse date
 
                     if retry_after_seconds > 0:
+                        retry_after_seconds = min(
+                            retry_after_seconds, remaining_seconds
+                        )
                         logger.warning(
-                            f"Attempt {attempt} failed for {fn.__name__}. "
-                            f"Honoring Retry-After header: waiting for {retry_after_seconds:.2f}s...",
+                            "Attempt %d failed for %s. Honoring Retry-After "
+                            "header: waiting for %.2fs...",
+                            attempt,
+                            fn.__name__,
+                            retry_after_seconds,
                         )
                         await asyncio.sleep(retry_after_seconds)
                         # Reset delay for next potential error that isn't a 429
-                        current_delay = initial_delay_ms
+                        previous_delay = initial_delay_ms
                         continue
 
-                    jitter = current_delay * 0.3 * (random.random() * 2 - 1)
-                    delay_with_jitter = max(0, current_delay + jitter)
+                    delay_with_jitter = min(
+                        max_delay_ms,
+                        random.uniform(initial_delay_ms, previous_delay * 3),
+                        remaining_seconds * 1000,
+                    )
+                    previous_delay = delay_with_jitter
 
                     logger.warning(
-                        f"Attempt {attempt} failed for {fn.__name__}. Retrying in {delay_with_jitter / 1000:.2f}s...",
+                        "Attempt %d failed for %s. Retrying in %.2fs...",
+                        attempt,
+                        fn.__name__,
+                        delay_with_jitter / 1000,
                         exc_info=True,
                     )
 
                     await asyncio.sleep(delay_with_jitter / 1000)
-                    current_delay = min(max_delay_ms, current_delay * 2)
 
             if last_error:
                 await report_error(
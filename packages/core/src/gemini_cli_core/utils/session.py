@@ -11,17 +11,27 @@ SESSION_ID = str(uuid4())
 _gemini_dir = Path.home() / GEMINI_DIR
 _installation_id_file = _gemini_dir / "installation_id"
 
+# Set once the directory is known to exist.
+_gemini_dir_ready = False
+# The installation ID never changes within a process; read the file once.
+_installation_id: str | None = None
+
 
 def _ensure_gemini_dir_exists():
     """Ensures the .gemini directory exists in the user's home directory."""
+    global _gemini_dir_ready
+    if _gemini_dir_ready:
+        return
     _gemini_dir.mkdir(parents=True, exist_ok=True)
+    _gemini_dir_ready = True
 
 
 def _read_installation_id() -> str | None:
     """Reads the installation ID from the file."""
-    if _installation_id_file.exists():
-        return _installation_id_file.read_text("utf-8").strip()
-    return None
+    try:
+        return _installation_id_file.read_bytes().decode("utf-8").strip()
+    except FileNotFoundError:
+        return None
 
 
 def _write_installation_id(installation_id: str):
@@ -33,12 +43,17 @@ def get_installation_id() -> str:
     """
     Retrieves the installation ID from a file, creating it if it doesn't exist.
     """
+    global _installation_id
+    if _installation_id is not None:
+        return _installation_id
+
     try:
         _ensure_gemini_dir_exists()
         installation_id = _read_installation_id()
         if not installation_id:
             installation_id = str(uuid4())
             _write_installation_id(installation_id)
+        _installation_id = installation_id
         return installation_id
     except Exception as e:
         logger.error(
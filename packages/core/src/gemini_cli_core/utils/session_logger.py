@@ -1,20 +1,39 @@
-import json
+import asyncio
 import logging
+import os
 import time
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from enum import Enum
 from pathlib import Path
+from typing import Any
 
-import aiofiles
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from gemini_cli_core.core.types import Content
+from gemini_cli_core.utils.json_utils import dumps, loads
 from gemini_cli_core.utils.paths import get_project_temp_dir
 
+# Advisory file locks keep appends from other processes whole (POSIX only).
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Checkpoints are machine-only; MessagePack is smaller and faster than JSON.
+try:
+    import ormsgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
-LOG_FILE_NAME = "logs.json"
+LOG_FILE_NAME = "logs.jsonl"
+# Older versions kept the whole log as one JSON array.
+LEGACY_LOG_FILE_NAME = "logs.json"
 CHECKPOINT_FILE_NAME = "checkpoint.json"
+CHECKPOINT_MSGPACK_SUFFIX = ".msgpack"
 
 
 class MessageSenderType(str, Enum):
@@ -24,10 +43,113 @@ class MessageSenderType(str, Enum):
 class LogEntry(BaseModel):
     session_id: str
     message_id: int
-    timestamp: str
+    # Nanoseconds since the epoch (UTC); formatted only when displayed.
+    timestamp: int
     type: MessageSenderType
     message: str
 
+    @property
+    def timestamp_iso(self) -> str:
+        """The timestamp as an ISO 8601 string in UTC."""
+        return datetime.fromtimestamp(self.timestamp / 1e9, UTC).isoformat()
+
+
+_LOG_ENTRIES_ADAPTER = TypeAdapter(list[LogEntry])
+
+
+def _read_log_entries_sync(path: Path) -> list[LogEntry]:
+    lines = [line for line in path.read_bytes().splitlines() if line.strip()]
+    if not lines:
+        return []
+    # Happy path: validate every line in one call as a single JSON array.
+    try:
+        return _LOG_ENTRIES_ADAPTER.validate_json(
+            b"[" + b",".join(lines) + b"]"
+        )
+    except ValidationError:
+        pass
+
+    # Some line is torn or invalid; validate line by line and skip it.
+    valid_logs = []
+    for line in lines:
+        try:
+            valid_logs.append(LogEntry.model_validate_json(line))
+        except ValidationError:
+            continue  # Skip invalid entries
+    return valid_logs
+
+
+def _legacy_timestamp_ns(value: Any) -> Any:
+    """Converts a legacy naive-UTC ISO timestamp to nanoseconds."""
+    if not isinstance(value, str):
+        return value
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    since_epoch = dt - datetime.fromtimestamp(0, UTC)
+    return since_epoch // timedelta(microseconds=1) * 1000
+
+
+def _migrate_legacy_log_sync(legacy_path: Path, log_path: Path) -> int:
+    """
+    Appends the entries of a legacy logs.json array to the JSONL log and
+    keeps the old file as logs.json.migrated. Returns the number of entries
+    imported.
+    """
+    migrated_path = legacy_path.with_name(legacy_path.name + ".migrated")
+    try:
+        # Renaming first claims the file, so concurrent sessions cannot
+        # import it twice.
+        os.rename(legacy_path, migrated_path)
+    except FileNotFoundError:
+        return 0
+    try:
+        data = loads(migrated_path.read_bytes())
+    except ValueError:
+        data = None
+    if not isinstance(data, list):
+        logger.debug(f"Skipping malformed legacy log file {legacy_path}")
+        return 0
+
+    lines = []
+    for item in data:
+        try:
+            item["timestamp"] = _legacy_timestamp_ns(item.get("timestamp"))
+            entry = LogEntry.model_validate(item)
+        except (AttributeError, TypeError, ValueError):
+            continue  # Skip invalid entries
+        lines.append(entry.model_dump_json() + "\n")
+    if lines:
+        _append_text_sync(log_path, "".join(lines))
+    return len(lines)
+
+
+def _load_checkpoint_sync(json_path: Path) -> list[Content]:
+    """Loads a MessagePack checkpoint, falling back to a legacy JSON one."""
+    if MSGPACK_AVAILABLE:
+        try:
+            data = json_path.with_suffix(CHECKPOINT_MSGPACK_SUFFIX).read_bytes()
+            return ormsgpack.unpackb(data)
+        except FileNotFoundError:
+            pass
+    return loads(json_path.read_bytes())
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Writes to a temporary file and renames it over `path`."""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(data)
+    # A crash mid-write leaves the previous file intact, never a torn one.
+    os.replace(tmp_path, path)
+
+
+def _append_text_sync(path: Path, data: str) -> None:
+    with path.open("a", encoding="utf-8") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        # Closing the file flushes the line and then releases the lock.
+        f.write(data)
+
 
 class SessionLogger:
     def __init__(self, session_id: str):
@@ -38,34 +160,24 @@ class SessionLogger:
         self.message_id: int = 0
         self.initialized: bool = False
         self.logs: list[LogEntry] = []
+        # Serializes message id assignment and the append in log_message.
+        self._write_lock = asyncio.Lock()
 
     async def _read_log_file(self) -> list[LogEntry]:
+        """
+        Reads the JSONL log in one streaming pass.
+
+        Blank, torn or otherwise invalid lines are skipped, so a write cut
+        short by a crash only loses that one entry.
+        """
         if not self.log_file_path:
             raise OSError("Log file path not set during read attempt.")
         try:
-            async with aiofiles.open(self.log_file_path, encoding="utf-8") as f:
-                content = await f.read()
-
-            parsed_logs = json.loads(content)
-            if not isinstance(parsed_logs, list):
-                await self._backup_corrupted_log_file("malformed_array")
-                return []
-
-            valid_logs = []
-            for entry_data in parsed_logs:
-                try:
-                    valid_logs.append(LogEntry.model_validate(entry_data))
-                except ValidationError:
-                    continue  # Skip invalid entries
-            return valid_logs
-
-        except FileNotFoundError:
-            return []
-        except json.JSONDecodeError:
-            logger.debug(
-                f"Invalid JSON in log file {self.log_file_path}. Backing up."
+            # One thread hop for the whole read instead of one per line.
+            return await asyncio.to_thread(
+                _read_log_entries_sync, self.log_file_path
             )
-            await self._backup_corrupted_log_file("invalid_json")
+        except FileNotFoundError:
             return []
         except Exception as e:
             logger.debug(
@@ -73,18 +185,6 @@ class SessionLogger:
             )
             raise
 
-    async def _backup_corrupted_log_file(self, reason: str):
-        if not self.log_file_path:
-            return
-        backup_path = self.log_file_path.with_suffix(
-            f".{reason}.{int(time.time())}.bak"
-        )
-        try:
-            await aiofiles.os.rename(self.log_file_path, backup_path)
-            logger.debug(f"Backed up corrupted log file to {backup_path}")
-        except Exception:
-            pass  # Ignore if rename fails
-
     async def initialize(self):
         if self.initialized:
             return
@@ -96,21 +196,22 @@ class SessionLogger:
 
             self.gemini_dir.mkdir(parents=True, exist_ok=True)
 
-            if not self.log_file_path.exists():
-                async with aiofiles.open(
-                    self.log_file_path, "w", encoding="utf-8"
-                ) as f:
-                    await f.write("[]")
+            imported = await asyncio.to_thread(
+                _migrate_legacy_log_sync,
+                self.gemini_dir / LEGACY_LOG_FILE_NAME,
+                self.log_file_path,
+            )
+            if imported:
+                logger.debug(f"Imported {imported} entries from legacy log")
 
             self.logs = await self._read_log_file()
-            session_logs = [
-                log for log in self.logs if log.session_id == self.session_id
-            ]
-            self.message_id = (
-                max(log.message_id for log in session_logs) + 1
-                if session_logs
-                else 0
-            )
+            self.message_id = 0
+            for log in self.logs:
+                if (
+                    log.session_id == self.session_id
+                    and log.message_id >= self.message_id
+                ):
+                    self.message_id = log.message_id + 1
             self.initialized = True
         except Exception as e:
             logger.error(f"Failed to initialize logger: {e}")
@@ -122,50 +223,32 @@ class SessionLogger:
         if not self.log_file_path:
             raise OSError("Log file path not set.")
 
-        # This logic should ideally be atomic using file locks
-        # For asyncio, a lock per logger instance can prevent race conditions
-        # from a single process, but not across processes.
-
-        current_logs = await self._read_log_file()
-        session_logs = [
-            log
-            for log in current_logs
-            if log.session_id == entry_to_append.session_id
-        ]
-        next_id = (
-            max(log.message_id for log in session_logs) + 1
-            if session_logs
-            else 0
-        )
-        entry_to_append.message_id = next_id
-
-        current_logs.append(entry_to_append)
-
-        async with aiofiles.open(
-            self.log_file_path, "w", encoding="utf-8"
-        ) as f:
-            await f.write(
-                json.dumps([log.model_dump() for log in current_logs], indent=2)
-            )
+        # Entries are appended one JSON object per line, so a write costs
+        # the size of the new entry rather than of the whole log. Message
+        # ids are tracked in memory per session, and each session only
+        # appends its own entries.
+        line = entry_to_append.model_dump_json() + "\n"
+        await asyncio.to_thread(_append_text_sync, self.log_file_path, line)
 
-        self.logs = current_logs
+        self.logs.append(entry_to_append)
         return entry_to_append
 
     async def log_message(self, type: MessageSenderType, message: str):
         if not self.initialized or self.session_id is None:
             return
 
-        new_entry = LogEntry(
-            session_id=self.session_id,
-            message_id=self.message_id,  # Will be recalculated in _update
-            type=type,
-            message=message,
-            timestamp=datetime.utcnow().isoformat(),
-        )
+        async with self._write_lock:
+            new_entry = LogEntry(
+                session_id=self.session_id,
+                message_id=self.message_id,
+                type=type,
+                message=message,
+                timestamp=time.time_ns(),
+            )
 
-        written_entry = await self._update_log_file(new_entry)
-        if written_entry:
-            self.message_id = written_entry.message_id + 1
+            written_entry = await self._update_log_file(new_entry)
+            if written_entry:
+                self.message_id = written_entry.message_id + 1
 
     def _get_checkpoint_path(self, tag: str | None = None) -> Path:
         if not self.checkpoint_file_path or not self.gemini_dir:
@@ -180,20 +263,19 @@ class SessionLogger:
         if not self.initialized:
             return
         path = self._get_checkpoint_path(tag)
-        async with aiofiles.open(path, "w", encoding="utf-8") as f:
-            await f.write(json.dumps(conversation, indent=2))
+        if MSGPACK_AVAILABLE:
+            path = path.with_suffix(CHECKPOINT_MSGPACK_SUFFIX)
+            data = ormsgpack.packb(conversation)
+        else:
+            data = dumps(conversation)
+        await asyncio.to_thread(_write_bytes_atomic, path, data)
 
     async def load_checkpoint(self, tag: str | None = None) -> list[Content]:
         if not self.initialized:
             return []
         path = self._get_checkpoint_path(tag)
-        if not path.exists():
-            return []
-
         try:
-            async with aiofiles.open(path, encoding="utf-8") as f:
-                content = await f.read()
-            return json.loads(content)
+            return await asyncio.to_thread(_load_checkpoint_sync, path)
         except Exception:
             return []
 
@@ -0,0 +1,182 @@
+# --- Converters from code_assist/converter.ts ---
+# These functions convert between the standard @google/genai format
+# and the Vertex AI-specific format used by the Code Assist service.
+# They live apart from response_utils so that only the Code Assist path
+# loads them.
+
+from dataclasses import asdict, dataclass, fields
+from typing import Any
+
+from gemini_cli_core.core.types import (
+    Content,
+    GenerateContentConfig,
+    Part,
+    SafetySetting,
+    ToolConfig,
+)
+
+
+# Plain slotted dataclasses for the Vertex AI-specific structures; they are
+# built and serialized on every Code Assist request, so no validation layer.
+@dataclass(slots=True)
+class VertexGenerationConfig:
+    temperature: float | None = None
+    top_p: float | None = None
+    top_k: int | None = None
+    candidate_count: int | None = None
+    max_output_tokens: int | None = None
+    stop_sequences: list[str] | None = None
+    # Add other fields as needed from the TS definition
+
+
+@dataclass(slots=True)
+class VertexGenerateContentRequest:
+    contents: list[Content]
+    system_instruction: Content | None = None
+    tools: list[dict] | None = None  # Simplified for now
+    tool_config: ToolConfig | None = None
+    safety_settings: list[SafetySetting] | None = None
+    generation_config: VertexGenerationConfig | None = None
+
+
+@dataclass(slots=True, kw_only=True)
+class CAGenerateContentRequest:
+    model: str
+    project: str | None = None
+    request: VertexGenerateContentRequest
+
+
+@dataclass(slots=True)
+class VertexCountTokenRequest:
+    model: str
+    contents: list[Content]
+
+
+@dataclass(slots=True)
+class CaCountTokenRequest:
+    request: VertexCountTokenRequest
+
+
+@dataclass(slots=True)
+class CaCountTokenResponse:
+    total_tokens: int
+
+
+@dataclass(slots=True)
+class Candidate:
+    # Simplified version
+    content: Content
+    # Add other fields like finish_reason, safety_ratings etc.
+
+
+@dataclass(slots=True)
+class VertexGenerateContentResponse:
+    candidates: list[Candidate]
+    # Add other fields like prompt_feedback, usage_metadata
+
+
+@dataclass(slots=True)
+class CaGenerateContentResponse:
+    response: VertexGenerateContentResponse
+
+
+_GENERATION_CONFIG_FIELDS = tuple(f.name for f in fields(VertexGenerationConfig))
+
+
+def _dict_without_none(items: list[tuple[str, Any]]) -> dict[str, Any]:
+    return {key: value for key, value in items if value is not None}
+
+
+def to_builtins(obj: Any) -> dict[str, Any]:
+    """Converts one of the models above to a JSON-ready dict, omitting None."""
+    return asdict(obj, dict_factory=_dict_without_none)
+
+
+# Conversion functions
+def _is_content(value: Any) -> bool:
+    """Checks whether a value is already a complete Content dict."""
+    # Content is a TypedDict, so isinstance() cannot be used here.
+    return isinstance(value, dict) and "role" in value and "parts" in value
+
+
+def to_content(content: Any) -> Content:
+    if _is_content(content):
+        return content
+    if isinstance(content, str):
+        return Content(role="user", parts=[Part(text=content)])
+    if isinstance(content, list):
+        return Content(
+            role="user",
+            parts=[Part(text=p) if isinstance(p, str) else p for p in content],
+        )
+    if isinstance(content, dict) and "parts" in content:
+        return Content(**content)
+    # Assuming it's a Part-like dict
+    return Content(role="user", parts=[Part(**content)])
+
+
+def to_contents(contents: Any) -> list[Content]:
+    if isinstance(contents, list):
+        # Histories are normally already Content dicts; pass them through.
+        if all(_is_content(c) for c in contents):
+            return contents
+        return [to_content(c) for c in contents]
+    return [to_content(contents)]
+
+
+def to_vertex_generation_config(
+    config: GenerateContentConfig | None,
+) -> VertexGenerationConfig | None:
+    if not config:
+        return None
+    # Copy only the fields Vertex understands, straight off the config.
+    return VertexGenerationConfig(
+        **{
+            name: value
+            for name in _GENERATION_CONFIG_FIELDS
+            if (value := getattr(config, name, None)) is not None
+        }
+    )
+
+
+def to_vertex_generate_content_request(
+    req: Any,
+) -> VertexGenerateContentRequest:
+    # Assuming req is a Pydantic model or dict with compatible structure
+    return VertexGenerateContentRequest(
+        contents=to_contents(req.contents),
+        system_instruction=to_content(req.config.system_instruction)
+        if req.config and req.config.system_instruction
+        else None,
+        tools=req.config.tools if req.config else None,
+        tool_config=req.config.tool_config if req.config else None,
+        safety_settings=req.config.safety_settings if req.config else None,
+        generation_config=to_vertex_generation_config(req.config),
+    )
+
+
+def to_generate_content_request(
+    req: Any, project: str | None = None
+) -> CAGenerateContentRequest:
+    return CAGenerateContentRequest(
+        model=req.model,
+        project=project,
+        request=to_vertex_generate_content_request(req),
+    )
+
+
+def from_generate_content_response(res: CaGenerateContentResponse) -> dict:
+    # This is a simplified conversion, assuming the client can handle the dict
+    return to_builtins(res.response)
+
+
+def to_count_token_request(req: Any) -> CaCountTokenRequest:
+    return CaCountTokenRequest(
+        request=VertexCountTokenRequest(
+            model=f"models/{req.model}", contents=to_contents(req.contents)
+        )
+    )
+
+
+def from_count_token_response(res: CaCountTokenResponse) -> dict:
+    return {"totalTokens": res.total_tokens}
@@ -1,6 +1,8 @@
 import asyncio
 import json
 import logging
+from contextlib import aclosing
+from dataclasses import dataclass
 from typing import Any
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
@@ -15,9 +17,33 @@ from gemini_cli_core.core import (
     UserInputMessage,
     WebSocketMessage,
 )
+from gemini_cli_core.core.graphs.conversation_graph import (
+    EventAwareGraph,
+    create_conversation_graph,
+)
+from gemini_cli_core.utils.fetch import close_shared_client
+from gemini_cli_core.utils.json_utils import loads
 
 logger = logging.getLogger(__name__)
 
+# 消息类型 -> 消息模型
+_MESSAGE_TYPES: dict[str, type[WebSocketMessage]] = {
+    "user_input": UserInputMessage,
+    "tool_confirmation_response": ToolConfirmationMessage,
+    "cancel_stream": CancelStreamMessage,
+}
+
+
+@dataclass(slots=True)
+class SessionContext:
+    """单个 WebSocket 会话的连接、事件发送器、对话图和对话任务"""
+
+    websocket: WebSocket
+    emitter: EventEmitter
+    task: asyncio.Task | None = None
+    # 编译后的对话图只依赖会话的配置和事件发送器, 在会话内复用
+    graph: EventAwareGraph | None = None
+
 
 class GeminiWebSocketServer:
     """WebSocket服务器 - 处理前后端通信"""
@@ -32,9 +58,7 @@ class GeminiWebSocketServer:
         """
         self.config = config
         self.app = FastAPI(title="Gemini CLI Core")
-        self.active_connections: dict[str, WebSocket] = {}
-        self.event_emitters: dict[str, EventEmitter] = {}
-        self.conversation_tasks: dict[str, asyncio.Task] = {}
+        self.sessions: dict[str, SessionContext] = {}
 
         # 配置CORS
         self.app.add_middleware(
@@ -47,6 +71,8 @@ class GeminiWebSocketServer:
 
         # 注册路由
         self._register_routes()
+        # 关闭网页抓取与模型探测共用的HTTP连接池
+        self.app.router.add_event_handler("shutdown", close_shared_client)
 
     def _register_routes(self) -> None:
         """注册WebSocket路由"""
@@ -72,12 +98,9 @@ class GeminiWebSocketServer:
         """
         await websocket.accept()
 
-        # 存储连接
-        self.active_connections[session_id] = websocket
-
-        # 创建事件发送器
+        # 创建事件发送器并存储会话
         emitter = EventEmitter(websocket)
-        self.event_emitters[session_id] = emitter
+        self.sessions[session_id] = SessionContext(websocket, emitter)
 
         logger.info(f"WebSocket connection established: {session_id}")
 
@@ -116,11 +139,18 @@ class GeminiWebSocketServer:
 
         """
         while True:
-            # 接收消息
-            raw_message = await websocket.receive_text()
+            # 接收消息: 二进制帧直接交给 JSON 解析, 不再先解码为 str
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(
+                    frame.get("code", 1000), frame.get("reason")
+                )
+            raw_message = frame.get("bytes")
+            if raw_message is None:
+                raw_message = frame.get("text", "")
 
             try:
-                message_data = json.loads(raw_message)
+                message_data = loads(raw_message)
                 message = self._parse_message(message_data)
 
                 # 处理不同类型的消息
@@ -130,7 +160,13 @@ class GeminiWebSocketServer:
                 logger.exception(f"Invalid JSON message: {e}")
                 await emitter.emit_error(
                     Exception("Invalid message format"),
-                    {"raw_message": raw_message},
+                    {
+                        "raw_message": raw_message.decode(
+                            "utf-8", errors="replace"
+                        )
+                        if isinstance(raw_message, bytes)
+                        else raw_message
+                    },
                 )
             except Exception as e:
                 logger.exception(f"Error handling message: {e}")
@@ -148,14 +184,10 @@ class GeminiWebSocketServer:
 
         """
         message_type = data.get("type")
-
-        if message_type == "user_input":
-            return UserInputMessage(**data)
-        if message_type == "tool_confirmation_response":
-            return ToolConfirmationMessage(**data)
-        if message_type == "cancel_stream":
-            return CancelStreamMessage(**data)
-        raise ValueError(f"Unknown message type: {message_type}")
+        message_cls = _MESSAGE_TYPES.get(message_type)
+        if message_cls is None:
+            raise ValueError(f"Unknown message type: {message_type}")
+        return message_cls.model_validate(data)
 
     async def _handle_message(
         self,
@@ -194,14 +226,20 @@ class GeminiWebSocketServer:
             emitter: 事件发送器
 
         """
-        # 取消之前的任务（如果有）
-        if session_id in self.conversation_tasks:
-            self.conversation_tasks[session_id].cancel()
-
-        # 创建新的对话任务
-        from ..graphs.conversation import create_conversation_graph
-
-        graph = create_conversation_graph(self.config, emitter)
+        # 取消之前的任务（如果有）, 并等待其结束:
+        # 对话图在会话内复用, 旧的运行必须先停止并清空事件队列
+        session = self.sessions.get(session_id)
+        if session is not None and session.task is not None:
+            session.task.cancel()
+            await asyncio.gather(session.task, return_exceptions=True)
+
+        # 获取 (首次时创建) 会话的对话图
+        if session is not None and session.graph is not None:
+            graph = session.graph
+        else:
+            graph = create_conversation_graph(self.config, emitter)
+            if session is not None:
+                session.graph = graph
 
         # 初始状态
         initial_state = {
@@ -233,7 +271,8 @@ class GeminiWebSocketServer:
         task = asyncio.create_task(
             self._run_conversation(graph, initial_state, session_id, emitter),
         )
-        self.conversation_tasks[session_id] = task
+        if session is not None:
+            session.task = task
 
     async def _handle_tool_confirmation(
         self,
@@ -268,8 +307,9 @@ class GeminiWebSocketServer:
 
         """
         # 取消当前任务
-        if session_id in self.conversation_tasks:
-            self.conversation_tasks[session_id].cancel()
+        session = self.sessions.get(session_id)
+        if session is not None and session.task is not None:
+            session.task.cancel()
             await emitter.emit(
                 GeminiEventType.MODEL_RESPONSE,
                 {"content": "Stream cancelled", "streaming": False},
@@ -293,14 +333,15 @@ class GeminiWebSocketServer:
 
         """
         try:
-            # 执行图
-            async for state in graph.astream(initial_state):
-                # 检查是否被取消
-                if state.get("is_cancelled"):
-                    break
+            # 执行图 (aclosing 保证提前退出时图的执行也随之停止)
+            async with aclosing(graph.astream(initial_state)) as states:
+                async for state in states:
+                    # 检查是否被取消
+                    if state.get("is_cancelled"):
+                        break
 
-                # 处理状态更新
-                # TODO: 根据状态变化发送相应事件
+                    # 处理状态更新
+                    # TODO: 根据状态变化发送相应事件
 
             # 发送回合完成事件
             await emitter.emit_turn_complete(
@@ -323,14 +364,13 @@ class GeminiWebSocketServer:
             session_id: 会话ID
 
         """
-        # 移除连接
-        self.active_connections.pop(session_id, None)
-        self.event_emitters.pop(session_id, None)
-
-        # 取消任务
-        if session_id in self.conversation_tasks:
-            self.conversation_tasks[session_id].cancel()
-            self.conversation_tasks.pop(session_id, None)
+        # 移除会话, 取消任务并移除对话图的事件监听器
+        session = self.sessions.pop(session_id, None)
+        if session is not None:
+            if session.task is not None:
+                session.task.cancel()
+            if session.graph is not None:
+                session.graph.cleanup()
 
         logger.info(f"Session cleaned up: {session_id}")
 
@@ -0,0 +1,46 @@
+from pathlib import Path
+
+import pytest
+
+from gemini_cli_core.tools.file.glob import _compile_rglob, _find_matches
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    for rel in [
+        "a.py",
+        "src/b.py",
+        "src/e.txt",
+        "src/sub/c.py",
+        "docs/d.md",
+    ]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "*.py",
+        "**/*.py",
+        "src/*.py",
+        "./src/*.py",
+        "src/./*.py",
+        "src//*.py",
+        "sub/*.py",
+        "src/**/*.py",
+        "*.[mt][dx]*",
+    ],
+)
+def test_matches_path_rglob(tree: Path, pattern: str) -> None:
+    matches, _ = _find_matches(str(tree), _compile_rglob(pattern, True))
+    expected = [str(p) for p in tree.rglob(pattern) if p.is_file()]
+    assert sorted(matches) == sorted(expected)
+
+
+@pytest.mark.parametrize("pattern", ["/src/*.py", "../*.py", "src/../*.py"])
+def test_rejects_patterns_outside_the_root(pattern: str) -> None:
+    with pytest.raises(ValueError):
+        _compile_rglob(pattern, True)